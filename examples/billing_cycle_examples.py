@@ -15,6 +15,7 @@ Key features demonstrated:
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 import taipower_tou as tou
@@ -34,13 +35,46 @@ def print_subsection(title: str) -> None:
     print(f"\n--- {title} ---\n")
 
 
-def _residential_non_tou_inputs() -> tou.BillingInputs:
-    """Inputs to avoid minimum-usage advisory warnings in examples."""
-    return tou.BillingInputs(
-        meter_phase="single",
-        meter_voltage_v=110,
-        meter_ampere=10,
-    )
+# Inputs to avoid minimum-usage advisory warnings in examples
+_RES_NON_TOU_INPUTS = tou.BillingInputs(
+    meter_phase="single",
+    meter_voltage_v=110,
+    meter_ampere=10,
+)
+
+
+def _fixed_index(*stamps: str) -> pd.DatetimeIndex:
+    """Build a DatetimeIndex from ISO minute stamps without string inference."""
+    return pd.DatetimeIndex(np.array(stamps, dtype="datetime64[m]").astype("M8[ns]"))
+
+
+# Example timestamps are constant, so build every index once at import time
+_FIXTURES: dict[str, pd.DatetimeIndex] = {
+    "feb_mar_mid": _fixed_index(
+        "2025-02-15T10:00",
+        "2025-02-15T14:00",
+        "2025-03-15T10:00",
+        "2025-03-15T14:00",
+    ),
+    "feb_mar": _fixed_index(
+        "2025-02-01T00:00",
+        "2025-02-15T00:00",
+        "2025-03-01T00:00",
+        "2025-03-15T00:00",
+    ),
+    "jan_feb": _fixed_index(
+        "2025-01-01T00:00",
+        "2025-01-15T00:00",
+        "2025-02-01T00:00",
+        "2025-02-15T00:00",
+    ),
+    "dec_jan": _fixed_index("2024-12-15T00:00", "2025-01-15T00:00"),
+    "feb_mar_15": _fixed_index("2025-02-15T00:00", "2025-03-15T00:00"),
+    "oct_nov_15": _fixed_index("2025-10-15T00:00", "2025-11-15T00:00"),
+    "feb_apr_15": _fixed_index(
+        "2025-02-15T00:00", "2025-03-15T00:00", "2025-04-15T00:00"
+    ),
+}
 
 
 def example_billing_cycle_types() -> None:
@@ -48,15 +82,8 @@ def example_billing_cycle_types() -> None:
     print_section("Billing Cycle Types")
 
     # Create sample usage data across multiple months
-    dates = pd.to_datetime(
-        [
-            "2025-02-15 10:00",
-            "2025-02-15 14:00",
-            "2025-03-15 10:00",
-            "2025-03-15 14:00",
-        ]
-    )
-    usage = pd.Series([50.0, 50.0, 60.0, 60.0], index=dates)
+    dates = _FIXTURES["feb_mar_mid"]
+    usage = pd.Series(np.array([50.0, 50.0, 60.0, 60.0]), index=dates, copy=False)
 
     print("Usage data:")
     print(usage)
@@ -89,15 +116,8 @@ def example_odd_month_billing() -> None:
     print("  - (October, November) -> billed in November")
 
     # Create usage for February-March period
-    dates = pd.to_datetime(
-        [
-            "2025-02-01 00:00",
-            "2025-02-15 00:00",
-            "2025-03-01 00:00",
-            "2025-03-15 00:00",
-        ]
-    )
-    usage = pd.Series([80.0, 70.0, 90.0, 85.0], index=dates)
+    dates = _FIXTURES["feb_mar"]
+    usage = pd.Series(np.array([80.0, 70.0, 90.0, 85.0]), index=dates, copy=False)
 
     print_subsection("Usage for February-March period")
     print(usage)
@@ -111,7 +131,7 @@ def example_odd_month_billing() -> None:
     bill = tou.calculate_bill(
         usage,
         "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+        inputs=_RES_NON_TOU_INPUTS,
     )
     print(bill)
 
@@ -130,15 +150,8 @@ def example_even_month_billing() -> None:
     print("  - (November, December) -> billed in December")
 
     # Create usage for January-February period
-    dates = pd.to_datetime(
-        [
-            "2025-01-01 00:00",
-            "2025-01-15 00:00",
-            "2025-02-01 00:00",
-            "2025-02-15 00:00",
-        ]
-    )
-    usage = pd.Series([75.0, 80.0, 85.0, 90.0], index=dates)
+    dates = _FIXTURES["jan_feb"]
+    usage = pd.Series(np.array([75.0, 80.0, 85.0, 90.0]), index=dates, copy=False)
 
     print_subsection("Usage for January-February period")
     print(usage)
@@ -155,13 +168,8 @@ def example_year_crossing() -> None:
     print_subsection("ODD_MONTH: December-January crossing")
     print("December usage is billed together with January of the NEXT year")
 
-    dates = pd.to_datetime(
-        [
-            "2024-12-15 00:00",
-            "2025-01-15 00:00",
-        ]
-    )
-    usage = pd.Series([150.0, 160.0], index=dates)
+    dates = _FIXTURES["dec_jan"]
+    usage = pd.Series(np.array([150.0, 160.0]), index=dates, copy=False)
 
     print(f"Usage:\n{usage}\n")
 
@@ -188,30 +196,22 @@ def example_tier_doubling() -> None:
     print("  - Bimonthly tier 1: 0-240 kWh @ 1.78 NT/kWh")
     print("  - Bimonthly tier 2: 241-660 kWh @ 2.55/2.26 NT/kWh")
 
-    print_subsection("Example 1: 200 kWh usage (stays in tier 1)")
-    dates = pd.to_datetime(["2025-02-01 00:00"])
-    usage = pd.Series([200.0], index=dates)
-
-    bill = tou.calculate_bill(
-        usage,
-        "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+    # One period of total usage each: the scalar path skips pandas entirely
+    low_bill, high_bill = (
+        tou.calculate_bill_scalar(
+            kwh, "residential_non_tou", 2025, 2, inputs=_RES_NON_TOU_INPUTS
+        )
+        for kwh in (200.0, 300.0)
     )
+
+    print_subsection("Example 1: 200 kWh usage (stays in tier 1)")
     print("Usage: 200 kWh")
-    print(f"Energy cost: {bill['energy_cost'].iloc[0]:.2f} NT")
+    print(f"Energy cost: {low_bill['energy_cost']:.2f} NT")
     print(f"(200 kWh × 1.78 NT/kWh = {200 * 1.78:.2f} NT)")
 
     print_subsection("Example 2: 300 kWh usage (crosses into tier 2)")
-    dates = pd.to_datetime(["2025-02-01 00:00"])
-    usage = pd.Series([300.0], index=dates)
-
-    bill = tou.calculate_bill(
-        usage,
-        "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
-    )
     print("Usage: 300 kWh")
-    print(f"Energy cost: {bill['energy_cost'].iloc[0]:.2f} NT")
+    print(f"Energy cost: {high_bill['energy_cost']:.2f} NT")
     print("Calculation:")
     print(f"  - First 240 kWh: 240 × 1.78 = {240 * 1.78:.2f} NT")
     print(f"  - Next 60 kWh: 60 × 2.26 = {60 * 2.26:.2f} NT")
@@ -229,20 +229,15 @@ def example_season_boundary_handling() -> None:
     print_subsection("February-March period (crosses season boundary)")
 
     # February is non-summer, March is summer
-    dates = pd.to_datetime(
-        [
-            "2025-02-15 00:00",  # Non-summer
-            "2025-03-15 00:00",  # Summer
-        ]
-    )
-    usage = pd.Series([120.0, 130.0], index=dates)
+    dates = _FIXTURES["feb_mar_15"]
+    usage = pd.Series(np.array([120.0, 130.0]), index=dates, copy=False)
 
     print(f"Usage:\n{usage}\n")
 
     bill = tou.calculate_bill(
         usage,
         "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+        inputs=_RES_NON_TOU_INPUTS,
     )
     print(f"Total usage: {usage.sum()} kWh")
     print(f"Energy cost: {bill['energy_cost'].iloc[0]:.2f} NT")
@@ -252,20 +247,15 @@ def example_season_boundary_handling() -> None:
 
     print_subsection("October-November period (both non-summer)")
 
-    dates = pd.to_datetime(
-        [
-            "2025-10-15 00:00",  # Non-summer
-            "2025-11-15 00:00",  # Non-summer
-        ]
-    )
-    usage = pd.Series([120.0, 130.0], index=dates)
+    dates = _FIXTURES["oct_nov_15"]
+    usage = pd.Series(np.array([120.0, 130.0]), index=dates, copy=False)
 
     print(f"Usage:\n{usage}\n")
 
     bill = tou.calculate_bill(
         usage,
         "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+        inputs=_RES_NON_TOU_INPUTS,
     )
     print(f"Total usage: {usage.sum()} kWh")
     print(f"Energy cost: {bill['energy_cost'].iloc[0]:.2f} NT")
@@ -279,14 +269,8 @@ def example_monthly_vs_bimonthly_comparison() -> None:
     print_section("Monthly vs Bimonthly Billing Comparison")
 
     # Create same usage pattern for both plans
-    dates = pd.to_datetime(
-        [
-            "2025-02-15 00:00",
-            "2025-03-15 00:00",
-            "2025-04-15 00:00",
-        ]
-    )
-    usage = pd.Series([150.0, 150.0, 150.0], index=dates)
+    dates = _FIXTURES["feb_apr_15"]
+    usage = pd.Series(np.array([150.0, 150.0, 150.0]), index=dates, copy=False)
 
     print("Usage pattern: 150 kWh each in Feb, Mar, Apr")
     print()
@@ -304,7 +288,7 @@ def example_monthly_vs_bimonthly_comparison() -> None:
     bill_bimonthly = tou.calculate_bill(
         usage,
         "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+        inputs=_RES_NON_TOU_INPUTS,
     )
     print(bill_bimonthly)
 
@@ -322,21 +306,13 @@ def example_practical_use_case() -> None:
     # For simplicity, use daily averages
     dates_q1 = pd.date_range("2025-01-01", "2025-03-31", freq="D")
     # Simulate seasonal pattern: higher in Jan/Feb (heating), lower in Mar
-    import numpy as np
-
-    daily_usage = []
-    for date in dates_q1:
-        if date.month == 1:
-            # January: ~10 kWh/day
-            daily_usage.append(10.0 + np.random.uniform(-2, 2))
-        elif date.month == 2:
-            # February: ~9 kWh/day
-            daily_usage.append(9.0 + np.random.uniform(-2, 2))
-        else:
-            # March: ~8 kWh/day
-            daily_usage.append(8.0 + np.random.uniform(-2, 2))
-
-    usage_q1 = pd.Series(daily_usage, index=dates_q1)
+    # January ~10 kWh/day, February ~9 kWh/day, March ~8 kWh/day
+    months = dates_q1.month.to_numpy()
+    base = np.select([months == 1, months == 2], [10.0, 9.0], default=8.0)
+    noise = np.random.default_rng(0).uniform(-2, 2, len(dates_q1))
+    daily_usage = base + noise
+
+    usage_q1 = pd.Series(daily_usage, index=dates_q1, copy=False)
 
     print(f"Total Q1 usage: {usage_q1.sum():.1f} kWh")
     print(f"Daily average: {usage_q1.mean():.1f} kWh/day")
@@ -347,7 +323,7 @@ def example_practical_use_case() -> None:
     bill = tou.calculate_bill(
         usage_q1,
         "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+        inputs=_RES_NON_TOU_INPUTS,
     )
 
     print(f"\nBilling periods: {len(bill)}")
@@ -358,7 +334,7 @@ def example_practical_use_case() -> None:
     breakdown = tou.calculate_bill_breakdown(
         usage_q1,
         "residential_non_tou",
-        inputs=_residential_non_tou_inputs(),
+        inputs=_RES_NON_TOU_INPUTS,
     )
 
     print("\nSummary:")
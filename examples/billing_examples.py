@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 import taipower_tou as tou
@@ -9,10 +10,11 @@ import taipower_tou as tou
 
 def main() -> None:
     usage = pd.Series(
-        [1.0, 2.0, 0.5],
+        np.array([1.0, 2.0, 0.5]),
         index=pd.to_datetime(
             ["2025-07-15 10:00", "2025-07-15 23:00", "2025-07-16 09:00"]
         ),
+        copy=False,
     )
 
     # Simple: just usage + plan id
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 import taipower_tou as tou
@@ -29,13 +30,14 @@ def create_sample_csv(filename: str = "sample_usage.csv") -> None:
 
 def import_from_csv_format_a(filename: str) -> pd.Series:
     """Import CSV Format A: timestamp and usage columns."""
-    df = pd.read_csv(filename, encoding="utf-8-sig")
-
-    # Ensure timestamp is datetime
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-    # Set timestamp as index
-    df = df.set_index("timestamp")
+    # Parse timestamps into the index while reading
+    df = pd.read_csv(
+        filename,
+        encoding="utf-8-sig",
+        index_col="timestamp",
+        parse_dates=["timestamp"],
+        dtype={"usage_kwh": np.float64},
+    )
 
     # Extract usage series
     usage = df["usage_kwh"]
@@ -45,11 +47,14 @@ def import_from_csv_format_a(filename: str) -> pd.Series:
 
 def import_from_csv_format_b(filename: str) -> pd.Series:
     """Import CSV Format B: Chinese column names."""
-    df = pd.read_csv(filename, encoding="utf-8-sig")
-
     # Handle Chinese column names
-    df["時間"] = pd.to_datetime(df["時間"])
-    df = df.set_index("時間")
+    df = pd.read_csv(
+        filename,
+        encoding="utf-8-sig",
+        index_col="時間",
+        parse_dates=["時間"],
+        dtype={"用電度數": np.float64},
+    )
 
     usage = df["用電度數"]
 
@@ -58,15 +63,15 @@ def import_from_csv_format_b(filename: str) -> pd.Series:
 
 def import_from_csv_format_c(filename: str) -> pd.Series:
     """Import CSV Format C: Multiple columns with meter readings."""
-    df = pd.read_csv(filename, encoding="utf-8-sig")
-
-    df["datetime"] = pd.to_datetime(df["datetime"])
-    df = df.set_index("datetime")
+    df = pd.read_csv(
+        filename,
+        encoding="utf-8-sig",
+        index_col="datetime",
+        parse_dates=["datetime"],
+    )
 
     # Calculate usage from readings (current - previous)
-    df["usage"] = df["reading"].diff().fillna(0)
-
-    usage = df["usage"]
+    usage = df["reading"].diff().fillna(0).rename("usage")
 
     return usage
 
@@ -125,17 +130,19 @@ def export_to_csv(
         hourly_rates.append(rate)
 
     # Calculate hourly costs
-    hourly_costs = usage.values * pd.Series(hourly_rates, index=usage.index).values
+    rate_array = np.asarray(hourly_rates, dtype=np.float64)
+    hourly_costs = usage.to_numpy() * rate_array
 
     result = pd.DataFrame(
         {
-            "timestamp": usage.index.strftime("%Y-%m-%d %H:%M"),
             "usage_kwh": usage.values,
-            "rate_twd_per_kwh": hourly_rates,
+            "rate_twd_per_kwh": rate_array,
             "cost_twd": hourly_costs,
-        }
+        },
+        index=usage.index.rename("timestamp"),
     )
-    result.to_csv(filename, index=False, encoding="utf-8-sig")
+    # Let the CSV writer format timestamps instead of building strings first
+    result.to_csv(filename, encoding="utf-8-sig", date_format="%Y-%m-%d %H:%M")
     print(f"Results exported to: {filename}")
 
 
@@ -9,6 +9,10 @@ This example simulates a realistic household scenario with:
 
 from __future__ import annotations
 
+from calendar import monthrange
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
 from taipower_tou import BillingInputs, calculate_bill
@@ -33,66 +37,43 @@ def create_realistic_household_usage(
     Returns:
         pd.Series with hourly usage in kWh
     """
-    days = 31 if month in [1, 3, 5, 7, 8, 10, 12] else 30
-    dates = pd.date_range(f"{year}-{month:02d}-01", periods=24 * days, freq="h")
-
-    usage_values = []
-    for dt in dates:
-        hour = dt.hour
-        dow = dt.dayofweek
-        is_summer = month in [6, 7, 8, 9]  # June-September
-        is_weekend = dow >= 5
-
-        # Initialize all loads
-        base_load = 0.15  # Refrigerator, WiFi router, standby devices
-        morning_load = 0.0
-        daytime_load = 0.0
-        evening_load = 0.0
-        night_load = 0.0
-        ac_load = 0.0
-
-        # Morning routine (6-9 AM)
-        if 6 <= hour < 9:
-            morning_load = 0.8 if is_weekend else 1.2  # Shower pump, cooking
-
-        # Daytime low usage (9 AM - 5 PM)
-        if 9 <= hour < 17:
-            if is_weekend:
-                daytime_load = 1.0
-            else:
-                daytime_load = 0.3  # Most people at work
-
-        # Evening peak (5 PM - 11 PM)
-        if 17 <= hour < 23:
-            if is_weekend:
-                evening_load = 1.5
-            else:
-                evening_load = 2.0
-
-        # Night (11 PM - 6 AM)
-        if hour >= 23 or hour < 6:
-            night_load = 0.2
-
-        # Air conditioning (summer only)
-        if include_ac and is_summer:
-            if ac_hours_start <= hour < ac_hours_end:
-                if is_weekend:
-                    ac_load = 1.5  # Weekend AC use
-                else:
-                    ac_load = 2.5  # Weekday AC use (higher temp)
-
-        # Total hourly usage
-        total = (
-            base_load
-            + morning_load
-            + daytime_load
-            + evening_load
-            + night_load
-            + ac_load
-        )
-        usage_values.append(total)
+    days = monthrange(year, month)[1]
+    start = np.datetime64(f"{year}-{month:02d}-01T00", "h")
+    dates = pd.DatetimeIndex(
+        (start + np.arange(24 * days, dtype=np.int64)).astype("datetime64[ns]")
+    )
 
-    return pd.Series(usage_values, index=dates)
+    # Decode the index once and build every load as a whole-month array
+    hours = dates.hour.to_numpy()
+    dow = dates.dayofweek.to_numpy()
+    is_summer = month in [6, 7, 8, 9]  # June-September
+    is_weekend = dow >= 5
+
+    morning = (hours >= 6) & (hours < 9)
+    daytime = (hours >= 9) & (hours < 17)
+    evening = (hours >= 17) & (hours < 23)
+    night = (hours >= 23) | (hours < 6)
+    ac_mask = (hours >= ac_hours_start) & (hours < ac_hours_end)
+
+    base_load = 0.15  # Refrigerator, WiFi router, standby devices
+    # Morning routine (6-9 AM): shower pump, cooking
+    morning_load = np.where(morning, np.where(is_weekend, 0.8, 1.2), 0.0)
+    # Daytime low usage (9 AM - 5 PM): most people at work on weekdays
+    daytime_load = np.where(daytime, np.where(is_weekend, 1.0, 0.3), 0.0)
+    # Evening peak (5 PM - 11 PM)
+    evening_load = np.where(evening, np.where(is_weekend, 1.5, 2.0), 0.0)
+    # Night (11 PM - 6 AM)
+    night_load = np.where(night, 0.2, 0.0)
+    # Air conditioning (summer only): higher weekday temperatures
+    if include_ac and is_summer:
+        ac_load = np.where(ac_mask, np.where(is_weekend, 1.5, 2.5), 0.0)
+    else:
+        ac_load = np.zeros(len(hours))
+
+    total = base_load + morning_load + daytime_load + evening_load + night_load
+    total = total + ac_load
+
+    return pd.Series(total, index=dates, copy=False)
 
 
 def calculate_monthly_bill(usage: pd.Series) -> pd.DataFrame:
@@ -107,26 +88,50 @@ def calculate_monthly_bill(usage: pd.Series) -> pd.DataFrame:
     return bill
 
 
-def show_consumption_analysis(usage: pd.Series) -> None:
+@dataclass(frozen=True)
+class UsageStats:
+    """Hour-of-day and day-of-week usage tables shared by the analyses below."""
+
+    sum_by_hour: np.ndarray
+    count_by_hour: np.ndarray
+    sum_by_dow: np.ndarray
+    total_kwh: float
+
+    @classmethod
+    def from_usage(cls, usage: pd.Series) -> UsageStats:
+        """Bin usage by hour of day and day of week in a single pass."""
+        values = usage.to_numpy()
+        hours = usage.index.hour.to_numpy()
+        dow = usage.index.dayofweek.to_numpy()
+        sum_by_hour = np.bincount(hours, weights=values, minlength=24)
+        return cls(
+            sum_by_hour=sum_by_hour,
+            count_by_hour=np.bincount(hours, minlength=24),
+            sum_by_dow=np.bincount(dow, weights=values, minlength=7),
+            total_kwh=float(sum_by_hour.sum()),
+        )
+
+
+def show_consumption_analysis(stats: UsageStats) -> None:
     """Analyze consumption patterns."""
     print("=" * 70)
     print("Consumption Analysis")
     print("=" * 70)
 
+    sum_by_hour = stats.sum_by_hour
+    sum_by_dow = stats.sum_by_dow
+
     # Total usage
-    total_kwh = usage.sum()
-    daily_avg = total_kwh / len(usage) * 24
+    total_kwh = stats.total_kwh
+    daily_avg = total_kwh / stats.count_by_hour.sum() * 24
 
     # Peak vs off-peak breakdown
-    peak_hours = usage.index.hour.isin(range(9, 24))
-    off_peak_hours = usage.index.hour.isin(range(0, 9))
-
-    peak_usage = usage[peak_hours].sum()
-    off_peak_usage = usage[off_peak_hours].sum()
+    peak_usage = sum_by_hour[9:24].sum()
+    off_peak_usage = sum_by_hour[0:9].sum()
 
     # Weekend vs weekday
-    weekday_usage = usage[usage.index.dayofweek < 5].sum()
-    weekend_usage = usage[usage.index.dayofweek >= 5].sum()
+    weekday_usage = sum_by_dow[:5].sum()
+    weekend_usage = sum_by_dow[5:].sum()
 
     print(f"Total Monthly Usage:      {total_kwh:8.2f} kWh")
     print(f"Daily Average:            {daily_avg:8.2f} kWh/day")
@@ -144,21 +149,20 @@ def show_consumption_analysis(usage: pd.Series) -> None:
     print()
 
 
-def show_appliance_breakdown(usage: pd.Series) -> None:
+def show_appliance_breakdown(stats: UsageStats) -> None:
     """Estimate usage by appliance category."""
     print("=" * 70)
     print("Estimated Appliance Breakdown")
     print("=" * 70)
 
     # Rough estimation based on hourly patterns
-    total_kwh = usage.sum()
+    total_kwh = stats.total_kwh
 
     # Base load (24/7)
-    base_load_kwh = 0.15 * len(usage)  # 0.15 kWh/hour * hours
+    base_load_kwh = 0.15 * stats.count_by_hour.sum()  # 0.15 kWh/hour * hours
 
     # AC usage (estimate)
-    ac_hours = (usage.index.hour >= 14) & (usage.index.hour < 23)
-    ac_hours_count = ac_hours.sum()
+    ac_hours_count = int(stats.count_by_hour[14:23].sum())
     ac_kwh = 2.0 * ac_hours_count  # Approx 2 kW when running
 
     # Other usage
@@ -179,15 +183,17 @@ def show_appliance_breakdown(usage: pd.Series) -> None:
     print()
 
 
-def suggest_cost_saving_tips(usage: pd.Series, bill: pd.DataFrame) -> None:
+def suggest_cost_saving_tips(stats: UsageStats, bill: pd.DataFrame) -> None:
     """Suggest cost-saving tips based on usage patterns."""
     print("=" * 70)
     print("Money-Saving Tips")
     print("=" * 70)
 
+    sum_by_hour = stats.sum_by_hour
+    sum_by_dow = stats.sum_by_dow
+
     # Calculate potential savings from shifting usage
-    peak_hours = usage.index.hour.isin(range(9, 24))
-    peak_usage = usage[peak_hours].sum()
+    peak_usage = sum_by_hour[9:24].sum()
 
     # If 20% of peak usage shifted to off-peak
     shifted_kwh = peak_usage * 0.2
@@ -202,8 +208,8 @@ def suggest_cost_saving_tips(usage: pd.Series, bill: pd.DataFrame) -> None:
     print()
 
     # AC tips
-    total_kwh = usage.sum()
-    ac_kwh = 2.0 * ((usage.index.hour >= 14) & (usage.index.hour < 23)).sum()
+    total_kwh = stats.total_kwh
+    ac_kwh = 2.0 * stats.count_by_hour[14:23].sum()
     ac_pct = ac_kwh / total_kwh * 100
 
     print(f"💡 AC accounts for ~{ac_pct:.0f}% of your bill")
@@ -213,8 +219,8 @@ def suggest_cost_saving_tips(usage: pd.Series, bill: pd.DataFrame) -> None:
     print()
 
     # Weekend vs weekday
-    weekday_avg = usage[usage.index.dayofweek < 5].sum() / 30 / 24
-    weekend_avg = usage[usage.index.dayofweek >= 5].sum() / 30 / 24
+    weekday_avg = sum_by_dow[:5].sum() / 30 / 24
+    weekend_avg = sum_by_dow[5:].sum() / 30 / 24
 
     if weekday_avg > weekend_avg:
         print("💡 Weekday usage is higher: Consider weekend activities")
@@ -239,19 +245,21 @@ def main() -> None:
     print("-" * 70)
 
     usage_july = create_realistic_household_usage(year=2025, month=7, include_ac=True)
-    show_consumption_analysis(usage_july)
-    show_appliance_breakdown(usage_july)
+    stats_july = UsageStats.from_usage(usage_july)
+    show_consumption_analysis(stats_july)
+    show_appliance_breakdown(stats_july)
 
     bill_july = calculate_monthly_bill(usage_july)
 
     print("Monthly Bill Breakdown:")
     print("-" * 70)
-    print(f"Energy Cost:    {bill_july['energy_cost'].iloc[0]:8.2f} TWD")
-    print(f"Basic Fee:      {bill_july['basic_cost'].iloc[0]:8.2f} TWD")
-    print(f"Total Bill:      {bill_july['total'].iloc[0]:8.2f} TWD")
+    july = bill_july.iloc[0]
+    print(f"Energy Cost:    {july['energy_cost']:8.2f} TWD")
+    print(f"Basic Fee:      {july['basic_cost']:8.2f} TWD")
+    print(f"Total Bill:      {july['total']:8.2f} TWD")
     print()
 
-    suggest_cost_saving_tips(usage_july, bill_july)
+    suggest_cost_saving_tips(stats_july, bill_july)
 
     # Scenario 2: Winter month (no AC)
     print()
@@ -261,7 +269,7 @@ def main() -> None:
     usage_jan = create_realistic_household_usage(year=2025, month=1, include_ac=False)
     bill_jan = calculate_monthly_bill(usage_jan)
 
-    total_july = bill_july["total"].iloc[0]
+    total_july = july["total"]
     total_jan = bill_jan["total"].iloc[0]
 
     print(f"Total Bill: {total_jan:8.2f} TWD")
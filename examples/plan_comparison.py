@@ -8,11 +8,29 @@ This example shows how to:
 
 from __future__ import annotations
 
+import sys
+from calendar import monthrange
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 import taipower_tou as tou
 
 
+@lru_cache(maxsize=16)
+def _date_range(start: str, periods: int, freq: str) -> pd.DatetimeIndex:
+    """Cached ``pd.date_range``; DatetimeIndex is immutable, so sharing is safe."""
+    return pd.date_range(start, periods=periods, freq=freq)
+
+
+# Hourly usage by (day of week, hour): weekends (Sat, Sun) are flat and
+# weekdays peak between 9 AM and 9 PM. Index with ``dayofweek * 24 + hour``.
+_PROFILE_LUT = np.full(7 * 24, 0.8)
+_PROFILE_LUT.reshape(7, 24)[:5, 9:21] = 2.5
+_PROFILE_LUT[5 * 24 :] = 1.0
+
+
 def create_household_usage(summer_month: bool = True) -> pd.Series:
     """Create typical household usage pattern.
 
@@ -20,22 +38,39 @@ def create_household_usage(summer_month: bool = True) -> pd.Series:
         summer_month: True for July (summer), False for January (non-summer)
     """
     month = 7 if summer_month else 1
-    days = 31 if month in [1, 3, 5, 7, 8, 10, 12] else 30
+    days = monthrange(2025, month)[1]
 
-    dates = pd.date_range(f"2025-{month:02d}-01", periods=24 * days, freq="h")
-    hour = dates.hour
-    day_of_week = dates.dayofweek
+    dates = _date_range(f"2025-{month:02d}-01", 24 * days, "h")
+    slot = dates.dayofweek.to_numpy() * 24 + dates.hour.to_numpy()
+    return pd.Series(_PROFILE_LUT[slot], index=dates, copy=False)
 
-    usage_values = []
-    for h, dow in zip(hour, day_of_week):
-        if dow >= 5:  # Weekend (Sat, Sun)
-            usage_values.append(1.0)
-        elif 9 <= h < 21:  # Weekday peak hours
-            usage_values.append(2.5)
-        else:  # Off-peak
-            usage_values.append(0.8)
 
-    return pd.Series(usage_values, index=dates)
+@lru_cache(maxsize=64)
+def _plan_requirements(plan_id: str) -> dict[str, object] | None:
+    """Cached ``tou.get_plan_requirements``; ``None`` for unknown plan IDs."""
+    try:
+        return tou.get_plan_requirements(plan_id)
+    except KeyError:
+        return None
+
+
+def _comparable_plans(plan_ids: list[str]) -> list[str]:
+    """Keep the plans this demo can price without extra billing inputs.
+
+    Unknown IDs and plans that need a contract capacity are skipped up front,
+    so the cost calculation itself runs without per-plan error handling.
+    Meter specs only affect basic fees, which energy costs do not include.
+    """
+    comparable = []
+    for plan_id in plan_ids:
+        requirements = _plan_requirements(plan_id)
+        if requirements is None:
+            print(f"Skipping {plan_id}: unknown plan")
+        elif requirements["requires_contract_capacity"]:
+            print(f"Skipping {plan_id}: requires contract capacity")
+        else:
+            comparable.append(plan_id)
+    return comparable
 
 
 def compare_residential_plans(usage: pd.Series) -> pd.DataFrame:
@@ -49,34 +84,32 @@ def compare_residential_plans(usage: pd.Series) -> pd.DataFrame:
         "residential_simple_3_tier",
     ]
 
-    results = []
-    for plan_id in residential_plans:
-        plan = tou.plan(plan_id)
-        try:
-            costs = plan.calculate_costs(usage)
-            total_cost = costs.sum()
-            total_kwh = usage.sum()
-            avg_rate = total_cost / total_kwh
-
-            results.append(
-                {
-                    "plan_id": plan_id,
-                    "name": plan.name,
-                    "total_cost": total_cost,
-                    "total_kwh": total_kwh,
-                    "avg_rate": avg_rate,
-                    "rank": 0,  # Will be filled
-                }
-            )
-        except Exception as e:
-            print(f"Error calculating {plan_id}: {e}")
-
-    df = pd.DataFrame(results)
-    df = df.sort_values("total_cost")
-    df["rank"] = range(1, len(df) + 1)
-    df = df.reset_index(drop=True)
-
-    return df
+    total_kwh = usage.sum()
+    plan_ids: list[str] = []
+    names: list[str] = []
+    total_costs: list[float] = []
+    costs_by_plan = tou.calculate_costs_multi(
+        usage, _comparable_plans(residential_plans)
+    )
+    for plan_id, costs in costs_by_plan.items():
+        total_costs.append(costs.sum())
+        plan_ids.append(plan_id)
+        names.append(tou.plan(plan_id).name)
+
+    # Order plans cheapest first before building the frame
+    cost_array = np.asarray(total_costs, dtype=np.float64)
+    order = np.argsort(cost_array, kind="stable")
+    cost_array = cost_array[order]
+    return pd.DataFrame(
+        {
+            "plan_id": np.asarray(plan_ids, dtype=object)[order],
+            "name": np.asarray(names, dtype=object)[order],
+            "total_cost": cost_array,
+            "total_kwh": np.full(len(cost_array), total_kwh),
+            "avg_rate": cost_array / total_kwh,
+            "rank": np.arange(1, len(cost_array) + 1),
+        }
+    )
 
 
 def compare_business_plans(usage: pd.Series) -> pd.DataFrame:
@@ -91,108 +124,120 @@ def compare_business_plans(usage: pd.Series) -> pd.DataFrame:
         "lighting_standard_3_tier",
     ]
 
-    results = []
-    for plan_id in business_plans:
-        plan = tou.plan(plan_id)
-        try:
-            costs = plan.calculate_costs(usage)
-            total_cost = costs.sum()
-
-            results.append(
-                {
-                    "plan_id": plan_id,
-                    "name": plan.name,
-                    "total_cost": total_cost,
-                }
-            )
-        except Exception as e:
-            print(f"Error calculating {plan_id}: {e}")
-
-    df = pd.DataFrame(results)
-    df = df.sort_values("total_cost")
-    df["rank"] = range(1, len(df) + 1)
-    df = df.reset_index(drop=True)
-
-    return df
+    plan_ids: list[str] = []
+    names: list[str] = []
+    total_costs: list[float] = []
+    costs_by_plan = tou.calculate_costs_multi(usage, _comparable_plans(business_plans))
+    for plan_id, costs in costs_by_plan.items():
+        total_costs.append(costs.sum())
+        plan_ids.append(plan_id)
+        names.append(tou.plan(plan_id).name)
+
+    # Order plans cheapest first before building the frame
+    cost_array = np.asarray(total_costs, dtype=np.float64)
+    order = np.argsort(cost_array, kind="stable")
+    return pd.DataFrame(
+        {
+            "plan_id": np.asarray(plan_ids, dtype=object)[order],
+            "name": np.asarray(names, dtype=object)[order],
+            "total_cost": cost_array[order],
+            "rank": np.arange(1, len(order) + 1),
+        }
+    )
 
 
 def print_comparison_table(df: pd.DataFrame, title: str = "Plan Comparison") -> None:
     """Pretty print comparison table."""
-    print("=" * 80)
-    print(title)
-    print("=" * 80)
-    print()
-
-    for i, row in df.iterrows():
+    lines = ["=" * 80, title, "=" * 80, ""]
+
+    has_avg_rate = "avg_rate" in df.columns
+    avg_rates = df["avg_rate"].to_numpy() if has_avg_rate else [None] * len(df)
+    rows = zip(
+        df["rank"].to_numpy(),
+        df["name"].to_numpy(),
+        df["total_cost"].to_numpy(),
+        avg_rates,
+    )
+    for i, (rank, name, total_cost, avg_rate) in enumerate(rows):
         rank_emoji = ["🥇", "🥈", "🥉"][i] if i < 3 else f"  {i + 1}"
-        print(f"{rank_emoji} #{row['rank']} {row['name']}")
-        print(f"    Cost: {row['total_cost']:8.2f} TWD", end="")
-        if "avg_rate" in row:
-            print(f"  |  Avg: {row['avg_rate']:.2f} TWD/kWh")
-        else:
-            print()
-        print()
+        lines.append(f"{rank_emoji} #{rank} {name}")
+        cost_line = f"    Cost: {total_cost:8.2f} TWD"
+        if has_avg_rate:
+            cost_line += f"  |  Avg: {avg_rate:.2f} TWD/kWh"
+        lines.append(cost_line)
+        lines.append("")
 
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("")
+    # One write per table instead of one print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def compare_summer_vs_winter() -> None:
     """Compare costs between summer and winter months."""
-    print()
-    print("Seasonal Cost Comparison")
-    print("=" * 80)
-
     plans = ["residential_simple_2_tier", "residential_simple_3_tier"]
 
-    print(f"{'Plan':<30} {'Summer (July)':>15} {'Winter (Jan)':>15} {'Difference':>15}")
-    print("-" * 80)
+    lines = [
+        "",
+        "Seasonal Cost Comparison",
+        "=" * 80,
+        f"{'Plan':<30} {'Summer (July)':>15} {'Winter (Jan)':>15} {'Difference':>15}",
+        "-" * 80,
+    ]
+
+    # The usage patterns do not depend on the plan, so build them once
+    summer_usage = create_household_usage(summer_month=True)
+    winter_usage = create_household_usage(summer_month=False)
+
+    summer_costs = tou.calculate_costs_multi(summer_usage, plans)
+    winter_costs = tou.calculate_costs_multi(winter_usage, plans)
 
     for plan_id in plans:
         plan = tou.plan(plan_id)
 
-        # Summer
-        summer_usage = create_household_usage(summer_month=True)
-        summer_cost = plan.calculate_costs(summer_usage).sum()
-
-        # Winter
-        winter_usage = create_household_usage(summer_month=False)
-        winter_cost = plan.calculate_costs(winter_usage).sum()
+        summer_cost = summer_costs[plan_id].sum()
+        winter_cost = winter_costs[plan_id].sum()
 
         diff = summer_cost - winter_cost
         diff_pct = (diff / winter_cost) * 100
 
-        line = (
+        lines.append(
             f"{plan.name:<30} {summer_cost:10.2f} TWD  {winter_cost:10.2f} TWD  "
             f"{diff:+7.2f} ({diff_pct:+.1f}%)"
         )
-        print(line)
 
-    print("=" * 80)
+    lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def show_time_of_day_breakdown(usage: pd.Series, plan_id: str) -> None:
     """Show cost breakdown by time of day."""
-    print()
-    print("Time-of-Day Cost Breakdown")
-    print("=" * 80)
-
     plan = tou.plan(plan_id)
     breakdown = plan.monthly_breakdown(usage, include_shares=True)
 
-    print(f"{'Period':<15} {'Usage (kWh)':>15} {'Cost (TWD)':>15} {'Cost Share':>12}")
-    print("-" * 80)
+    lines = [
+        "",
+        "Time-of-Day Cost Breakdown",
+        "=" * 80,
+        f"{'Period':<15} {'Usage (kWh)':>15} {'Cost (TWD)':>15} {'Cost Share':>12}",
+        "-" * 80,
+    ]
 
-    for _, row in breakdown.iterrows():
-        period_short = str(row["period"])[:12]
-        cost_share = row["cost_share"] * 100
-        # Break long line into multiple parts
-        print(
-            f"{period_short:<15} {row['usage_kwh']:13.2f}  {row['cost']:13.2f}  "
-            f"{cost_share:8.1f}%"
+    rows = zip(
+        breakdown["period"].to_numpy(),
+        breakdown["usage_kwh"].to_numpy(),
+        breakdown["cost"].to_numpy(),
+        breakdown["cost_share"].to_numpy(),
+    )
+    for period, usage_kwh, cost, cost_share in rows:
+        period_short = str(period)[:12]
+        lines.append(
+            f"{period_short:<15} {usage_kwh:13.2f}  {cost:13.2f}  "
+            f"{cost_share * 100:8.1f}%"
         )
 
-    print("=" * 80)
+    lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =============================================================================
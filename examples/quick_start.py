@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 import taipower_tou as tou
@@ -21,18 +22,17 @@ def main():
     print("Example 1: Single Hour Cost")
     print("=" * 60)
 
-    # Create 1 hour of usage (1 kWh)
-    dates = pd.date_range("2025-07-15 14:00", periods=1, freq="h")
-    usage = pd.Series([1.0], index=dates)
+    # 1 kWh used during one hour
+    when = datetime(2025, 7, 15, 14, 0)
 
     # Get plan and calculate
     plan = tou.plan("residential_simple_2_tier")  # or "簡易型二段式"
-    cost = plan.calculate_costs(usage).iloc[0]
+    cost = plan.calculate_cost_scalar(when, 1.0)
 
-    print(f"Date: {dates[0]}")
+    print(f"Date: {pd.Timestamp(when)}")
     print("Usage: 1 kWh")
     print(f"Plan: {plan.name}")
-    print(f"Period: {tou.period_at(dates[0], 'residential_simple_2_tier')}")
+    print(f"Period: {tou.period_at(when, 'residential_simple_2_tier')}")
     print(f"Cost: {cost:.2f} TWD")
     print()
 
@@ -47,15 +47,17 @@ def main():
     # Create 24 hours of usage
     dates = pd.date_range("2025-07-15", periods=24, freq="h")
     # Simulate typical household: higher in evening
-    usage = pd.Series([1.0] * 24, index=dates)
+    usage = pd.Series(np.ones(24), index=dates, copy=False)
 
     plan = tou.plan("residential_simple_2_tier")
     costs = plan.calculate_costs(usage)
     breakdown = plan.monthly_breakdown(usage)
 
-    print(f"Total cost: {costs.iloc[0]:.2f} TWD")
-    print(f"Total usage: {usage.sum():.1f} kWh")
-    print(f"Average rate: {costs.iloc[0] / usage.sum():.2f} TWD/kWh")
+    total_cost = costs.iloc[0]
+    total_usage = usage.sum()
+    print(f"Total cost: {total_cost:.2f} TWD")
+    print(f"Total usage: {total_usage:.1f} kWh")
+    print(f"Average rate: {total_cost / total_usage:.2f} TWD/kWh")
     print()
     print("Period breakdown:")
     print(breakdown.to_string(index=False))
@@ -108,18 +110,19 @@ def main():
     print("=" * 60)
 
     dates = pd.date_range("2025-07-01", periods=24 * 30, freq="h")  # July
-    usage = pd.Series([2.0] * len(dates), index=dates)
+    usage = pd.Series(np.full(len(dates), 2.0), index=dates, copy=False)
 
     plans_to_compare = [
         "residential_simple_2_tier",
         "residential_simple_3_tier",
     ]
+    # Build each plan once, outside the reporting loop
+    plans = {plan_id: tou.plan(plan_id) for plan_id in plans_to_compare}
 
     print(f"Usage: {usage.sum():.0f} kWh (July 2025)")
     print()
 
-    for plan_id in plans_to_compare:
-        plan = tou.plan(plan_id)
+    for plan_id, plan in plans.items():
         cost = plan.calculate_costs(usage).iloc[0]
         print(f"{plan_id:40s}: {cost:8.2f} TWD")
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 import taipower_tou as tou
@@ -12,8 +13,8 @@ import taipower_tou as tou
 
 def _sample_usage(start: datetime, periods: int, freq_minutes: int) -> pd.Series:
     index = pd.date_range(start=start, periods=periods, freq=f"{freq_minutes}min")
-    values = [1.0 + (i % 3) * 0.25 for i in range(periods)]
-    return pd.Series(values, index=index)
+    values = 1.0 + (np.arange(periods, dtype=np.float64) % 3) * 0.25
+    return pd.Series(values, index=index, copy=False)
 
 
 def main() -> None:
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
+import importlib
+import sys
+from collections.abc import Callable, Iterable
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
-
-from taipower_tou.billing import (
-    BillingInputs,
-    calculate_bill,
-    calculate_bill_breakdown,
-    calculate_bill_from_dict,
-    calculate_bill_from_list,
-    calculate_bill_simple,
+from typing import TYPE_CHECKING, Any
+
+from taipower_tou.calendar import (
+    TaiwanCalendar,
+    clear_calendar_cache,
+    taiwan_calendar,
 )
-from taipower_tou.calendar import TaiwanCalendar, taiwan_calendar
 from taipower_tou.custom import (
     CustomCalendar,
     WeekdayDayTypeStrategy,
@@ -31,7 +31,13 @@ from taipower_tou.errors import (
     PowerKitError,
     TariffError,
 )
-from taipower_tou.factory import PlanRequirements, PlanStore, TariffFactory
+from taipower_tou.factory import (
+    _PLAN_NAME_MAP,
+    PlanRequirements,
+    PlanStore,
+    TariffFactory,
+    _plan_store,
+)
 from taipower_tou.models import BillingCycleType
 from taipower_tou.tariff import (
     PeriodType,
@@ -43,11 +49,60 @@ from taipower_tou.tariff import (
     get_context,
     get_period,
 )
+from taipower_tou.tariff import calculate_costs_multi as _calculate_costs_multi
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from taipower_tou.billing import (
+        BillingInputs,
+        calculate_bill,
+        calculate_bill_breakdown,
+        calculate_bill_from_dict,
+        calculate_bill_from_list,
+        calculate_bill_scalar,
+        calculate_bill_simple,
+    )
 
 __version__ = "0.1.0"
 
+# Billing helpers are imported on first access (PEP 562) so that callers who
+# only need plans or holidays skip loading the billing module.
+_LAZY_ATTRS = {
+    "BillingInputs": "taipower_tou.billing",
+    "calculate_bill": "taipower_tou.billing",
+    "calculate_bill_breakdown": "taipower_tou.billing",
+    "calculate_bill_from_dict": "taipower_tou.billing",
+    "calculate_bill_from_list": "taipower_tou.billing",
+    "calculate_bill_scalar": "taipower_tou.billing",
+    "calculate_bill_simple": "taipower_tou.billing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    # List lazy names too, so dir() and completion show them before first use
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+def _resolve_calendar(
+    calendar: TaiwanCalendar | None, cache_dir: Path | None, api_timeout: int
+) -> TaiwanCalendar:
+    # taiwan_calendar() is cached, so the default calendar is built only once
+    if calendar is not None:
+        return calendar
+    return taiwan_calendar(cache_dir=cache_dir, api_timeout=api_timeout)
+
 
-def calculate_costs(usage: Any, plan: TariffPlan) -> Any:
+def calculate_costs(usage: pd.Series, plan: TariffPlan) -> pd.Series:
     return plan.calculate_costs(usage)
 
 
@@ -57,10 +112,18 @@ def is_holiday(
     cache_dir: Path | None = None,
     api_timeout: int = 10,
 ) -> bool:
-    calendar_instance = calendar or taiwan_calendar(
-        cache_dir=cache_dir, api_timeout=api_timeout
-    )
-    return calendar_instance.is_holiday(target)
+    return _resolve_calendar(calendar, cache_dir, api_timeout).is_holiday(target)
+
+
+def are_holidays(
+    targets: Iterable[object],
+    calendar: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> list[bool]:
+    """Return `is_holiday` for each target, resolving the calendar only once."""
+    check = _resolve_calendar(calendar, cache_dir, api_timeout).is_holiday
+    return [check(target) for target in targets]
 
 
 def residential_simple_2_tier_plan(
@@ -105,11 +168,11 @@ def residential_non_tou_plan(
 def available_plans() -> dict[str, str]:
     """Return dict of plan ID to Chinese name mapping.
 
+    Each call returns a new dict, so callers may modify it freely.
+
     Returns:
         {plan_id: chinese_name} mapping
     """
-    from taipower_tou.factory import _PLAN_NAME_MAP
-
     return dict(_PLAN_NAME_MAP)
 
 
@@ -125,6 +188,13 @@ def plan(
     Use the plan ID returned by `available_plans()`.
     使用 `available_plans()` 返回的 plan ID。
 
+    Plans are built once per canonical plan ID, calendar and billing cycle,
+    so repeated calls (including calls using a Chinese name or an alias of
+    the same plan) skip rebuilding the profile and rates. Each call returns
+    its own TariffPlan over those shared parts, so setting attributes such
+    as `billing_cycle_type` on it does not affect other callers.
+    Call `clear_plan_cache()` to drop cached plans.
+
     Args:
         name: The plan identifier (e.g., "residential_simple_2_tier")
         calendar_instance: Optional calendar instance
@@ -146,85 +216,227 @@ def plan(
         >>> plan = tou.plan("residential_non_tou",
         ...                 billing_cycle_type=BillingCycleType.ODD_MONTH)
     """
-    calendar = calendar_instance or taiwan_calendar(
-        cache_dir=cache_dir, api_timeout=api_timeout
+    calendar = _resolve_calendar(calendar_instance, cache_dir, api_timeout)
+    store = _plan_store()
+    if name in store:
+        # Canonical IDs are the common case; skip flexible name resolution
+        plan_id = name
+    else:
+        try:
+            plan_id = store.resolve_plan_id(name)
+        except KeyError as exc:
+            raise ValueError(f"Unsupported plan name: {name}") from exc
+    cached = _plan_for_id(plan_id, calendar, billing_cycle_type)
+    # A fresh wrapper keeps attribute changes by one caller out of the cache
+    return TariffPlan(cached.profile, cached.rates, cached.billing_cycle_type)
+
+
+@lru_cache(maxsize=128)
+def _plan_for_id(
+    plan_id: str,
+    calendar: TaiwanCalendar,
+    billing_cycle_type: BillingCycleType,
+) -> TariffPlan:
+    return TariffFactory(calendar, _plan_store()).create_plan(
+        plan_id, billing_cycle_type
+    )
+
+
+def clear_plan_cache() -> None:
+    """Drop the plans cached by `plan()` so later calls build new instances.
+
+    The cache keeps up to 128 plans, and each entry holds a reference to the
+    calendar it was built with. A `calendar_instance` passed to `plan()` or to
+    the billing helpers therefore stays alive until its entry is evicted or
+    this is called. Plans cached by the billing helpers are dropped as well.
+    """
+    _plan_for_id.cache_clear()
+    # Skip billing if it was never imported; loading it just to clear is wasted
+    billing = sys.modules.get("taipower_tou.billing")
+    if billing is not None:
+        billing._tariff_plan_for_id.cache_clear()
+
+
+def _select_plan(
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None,
+    cache_dir: Path | None,
+    api_timeout: int,
+    billing_cycle_type: BillingCycleType = BillingCycleType.MONTHLY,
+) -> TariffPlan:
+    # A prebuilt plan is used as is; the calendar arguments only apply to names
+    if isinstance(plan_name, TariffPlan):
+        return plan_name
+    return plan(
+        plan_name, calendar_instance, cache_dir, api_timeout, billing_cycle_type
     )
-    try:
-        return TariffFactory.create(
-            name, calendar=calendar, billing_cycle_type=billing_cycle_type
-        )
-    except KeyError as exc:
-        raise ValueError(f"Unsupported plan name: {name}") from exc
 
 
 def period_at(
     target: object,
-    plan_name: str,
+    plan_name: str | TariffPlan,
     calendar_instance: TaiwanCalendar | None = None,
     cache_dir: Path | None = None,
     api_timeout: int = 10,
 ) -> Any:
-    selected_plan = plan(plan_name, calendar_instance, cache_dir, api_timeout)
+    selected_plan = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout)
     return get_period(target, selected_plan.profile)
 
 
 def period_context(
     target: object,
-    plan_name: str,
+    plan_name: str | TariffPlan,
     calendar_instance: TaiwanCalendar | None = None,
     cache_dir: Path | None = None,
     api_timeout: int = 10,
 ) -> Any:
-    selected_plan = plan(plan_name, calendar_instance, cache_dir, api_timeout)
+    selected_plan = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout)
     return get_context(target, selected_plan.profile)
 
 
+def period_at_many(
+    targets: Iterable[object],
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> list[Any]:
+    """Return `period_at` for each target, resolving the plan only once."""
+    profile = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout).profile
+    return [get_period(target, profile) for target in targets]
+
+
+def period_context_many(
+    targets: Iterable[object],
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> list[Any]:
+    """Return `period_context` for each target, resolving the plan only once."""
+    profile = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout).profile
+    return [get_context(target, profile) for target in targets]
+
+
 def costs(
-    usage: Any,
-    plan_name: str,
+    usage: pd.Series,
+    plan_name: str | TariffPlan,
     calendar_instance: TaiwanCalendar | None = None,
     cache_dir: Path | None = None,
     api_timeout: int = 10,
-) -> Any:
-    selected_plan = plan(plan_name, calendar_instance, cache_dir, api_timeout)
-    return calculate_costs(usage, selected_plan)
+) -> pd.Series:
+    selected_plan = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout)
+    return selected_plan.calculate_costs(usage)
+
+
+def costs_many(
+    usages: Iterable[pd.Series],
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> list[pd.Series]:
+    """Return `costs` for each usage series, resolving the plan only once."""
+    selected_plan = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout)
+    return [selected_plan.calculate_costs(usage) for usage in usages]
+
+
+def make_cost_fn(
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> Callable[[pd.Series], pd.Series]:
+    """Return the plan's bound `calculate_costs`, for calling in a loop.
+
+    Example:
+        >>> cost_fn = tou.make_cost_fn("residential_simple_2_tier")
+        >>> results = [cost_fn(usage) for usage in usages]
+    """
+    return _select_plan(
+        plan_name, calendar_instance, cache_dir, api_timeout
+    ).calculate_costs
+
+
+def make_period_fn(
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> Callable[[object], Any]:
+    """Return a one-argument `period_at` bound to the plan's profile."""
+    profile = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout).profile
+    return partial(get_period, profile=profile)
+
+
+def make_context_fn(
+    plan_name: str | TariffPlan,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> Callable[[object], Any]:
+    """Return a one-argument `period_context` bound to the plan's profile."""
+    profile = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout).profile
+    return partial(get_context, profile=profile)
+
+
+def calculate_costs_multi(
+    usage: pd.Series,
+    plan_ids: Iterable[str],
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+) -> dict[str, pd.Series]:
+    """Calculate costs of one usage series under several plans.
+
+    Timestamps are classified by season and day type once for all plans that
+    share strategies, instead of once per plan.
+
+    Returns:
+        {plan_id: cost Series} in the order of ``plan_ids``
+    """
+    plans = {
+        plan_id: plan(plan_id, calendar_instance, cache_dir, api_timeout)
+        for plan_id in plan_ids
+    }
+    return _calculate_costs_multi(usage, plans)
 
 
 def monthly_breakdown(
-    usage: Any,
-    plan_name: str,
+    usage: pd.Series,
+    plan_name: str | TariffPlan,
     include_shares: bool = False,
     calendar_instance: TaiwanCalendar | None = None,
     cache_dir: Path | None = None,
     api_timeout: int = 10,
     billing_cycle_type: BillingCycleType = BillingCycleType.MONTHLY,
-) -> Any:
-    selected_plan = plan(
+) -> pd.DataFrame:
+    selected_plan = _select_plan(
         plan_name, calendar_instance, cache_dir, api_timeout, billing_cycle_type
     )
     return selected_plan.monthly_breakdown(usage, include_shares=include_shares)
 
 
 def plan_details(
-    plan_name: str,
+    plan_name: str | TariffPlan,
     calendar_instance: TaiwanCalendar | None = None,
     cache_dir: Path | None = None,
     api_timeout: int = 10,
 ) -> dict[str, Any]:
-    selected_plan = plan(plan_name, calendar_instance, cache_dir, api_timeout)
+    selected_plan = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout)
     return selected_plan.describe()
 
 
 def pricing_context(
     target: object,
-    plan_name: str,
-    usage: Any = None,
+    plan_name: str | TariffPlan,
+    usage: float | pd.Series | None = None,
     include_details: bool = False,
     calendar_instance: TaiwanCalendar | None = None,
     cache_dir: Path | None = None,
     api_timeout: int = 10,
 ) -> Any:
-    selected_plan = plan(plan_name, calendar_instance, cache_dir, api_timeout)
+    selected_plan = _select_plan(plan_name, calendar_instance, cache_dir, api_timeout)
     return selected_plan.pricing_context(
         target,
         usage_kwh=usage,
@@ -256,9 +468,9 @@ def get_plan_requirements(plan_name: str) -> dict[str, Any]:
         >>> print(reqs["valid_basic_fee_labels"])
         ['經常契約', '非夏月契約', '週六半尖峰契約', '離峰契約']
     """
-    store = PlanStore()
-    plan_data = store.resolve_plan(plan_name)
-    requirements = PlanRequirements.from_plan_data(plan_data)
+    store = _plan_store()
+    plan_id = plan_name if plan_name in store else store.resolve_plan_id(plan_name)
+    requirements = _requirements_for(plan_id)
 
     return {
         "requires_contract_capacity": requirements.requires_contract_capacity,
@@ -269,7 +481,13 @@ def get_plan_requirements(plan_name: str) -> dict[str, Any]:
     }
 
 
-__all__ = [
+@lru_cache(maxsize=64)
+def _requirements_for(plan_id: str) -> PlanRequirements:
+    # Shared between calls; get_plan_requirements copies what it returns
+    return PlanRequirements.from_plan_data(_plan_store().get_plan(plan_id))
+
+
+__all__ = (
     "TaiwanCalendar",
     "CustomCalendar",
     "BillingCycleType",
@@ -280,21 +498,31 @@ __all__ = [
     "TaiwanDayTypeStrategy",
     "TaiwanSeasonStrategy",
     "taiwan_calendar",
+    "clear_calendar_cache",
     "custom_calendar",
     "available_plans",
     "calculate_costs",
     "get_context",
     "get_period",
     "is_holiday",
+    "are_holidays",
     "high_voltage_2_tier_plan",
     "residential_non_tou_plan",
     "residential_simple_2_tier_plan",
     "period_at",
+    "period_at_many",
     "period_context",
+    "period_context_many",
     "pricing_context",
     "plan",
+    "clear_plan_cache",
     "plan_details",
     "costs",
+    "costs_many",
+    "make_cost_fn",
+    "make_period_fn",
+    "make_context_fn",
+    "calculate_costs_multi",
     "monthly_breakdown",
     "get_plan_requirements",
     "CalendarError",
@@ -314,6 +542,8 @@ __all__ = [
     "calculate_bill_simple",
     "calculate_bill_from_list",
     "calculate_bill_from_dict",
+    "calculate_bill_scalar",
     "PlanRequirements",
+    "PlanStore",
     "__version__",
-]
+)
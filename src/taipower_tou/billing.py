@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
 import pandas as pd
@@ -21,9 +22,17 @@ from taipower_tou.factory import (
     PlanRequirements,
     PlanStore,
     _build_tariff_plan_from_data,
+    _normalize_tiers,
+    _plan_store,
     _season_strategy,
 )
-from taipower_tou.models import BillingCycleType
+from taipower_tou.models import (
+    BillingCycleType,
+    ConsumptionTier,
+    SeasonType,
+    _label_value,
+)
+from taipower_tou.tariff import _tier_schedule, _tiered_cost, _total_kwh
 
 
 @dataclass
@@ -349,15 +358,31 @@ def _validate_usage_series(usage: pd.Series) -> None:
         raise InvalidUsageInput("usage timestamps must be ordered")
 
 
-def calculate_bill(
+class _BillingPrep(NamedTuple):
+    plan_data: dict[str, Any]
+    store: PlanStore
+    inputs: BillingInputs
+    tariff_plan: Any
+    context: pd.DataFrame
+    billing_periods: pd.PeriodIndex
+    usage_for_billing: pd.Series
+    energy_costs: pd.Series
+    month_index: pd.Index
+
+
+def _prepare_billing(
     usage: pd.Series,
     plan_id: str,
-    inputs: BillingInputs | None = None,
-    calendar_instance: TaiwanCalendar | None = None,
-    cache_dir: Path | None = None,
-    api_timeout: int = 10,
-    strict: bool = False,
-) -> pd.DataFrame:
+    inputs: BillingInputs | None,
+    calendar_instance: TaiwanCalendar | None,
+    cache_dir: Path | None,
+    api_timeout: int,
+    strict: bool,
+) -> _BillingPrep:
+    """Validate inputs and compute the state shared by the bill entry points.
+
+    Warnings are attributed to the caller of the public entry point.
+    """
     if not isinstance(usage, pd.Series):
         raise InvalidUsageInput("usage must be a pandas.Series")
     if not isinstance(usage.index, pd.DatetimeIndex):
@@ -365,21 +390,25 @@ def calculate_bill(
     _validate_usage_series(usage)
 
     inputs = inputs or BillingInputs()
-    store = PlanStore()
+    store = _plan_store()
     plan_data = store.resolve_plan(plan_id)
 
     # Validate inputs against plan requirements
     validation_warnings = _validate_billing_inputs(plan_data, inputs, strict=strict)
     for warning in validation_warnings:
-        warnings.warn(warning, UserWarning, stacklevel=2)
+        warnings.warn(warning, UserWarning, stacklevel=3)
 
     calendar = calendar_instance or taiwan_calendar(
         cache_dir=cache_dir, api_timeout=api_timeout
     )
 
     if inputs.billing_cycle_months is None:
-        inputs.billing_cycle_months = plan_data.get("billing_rules", {}).get(
-            "billing_cycle_months"
+        # Resolve on a copy so shared inputs are never mutated
+        inputs = replace(
+            inputs,
+            billing_cycle_months=plan_data.get("billing_rules", {}).get(
+                "billing_cycle_months"
+            ),
         )
 
     usage_for_billing = _apply_minimum_usage(plan_data, store, usage, inputs)
@@ -394,11 +423,8 @@ def calculate_bill(
         # (can be overridden by adding logic to determine odd vs even)
         billing_cycle_type = BillingCycleType.ODD_MONTH
 
-    tariff_plan = _build_tariff_plan_from_data(
-        plan_data,
-        store,
-        calendar,
-        billing_cycle_type=billing_cycle_type,
+    tariff_plan = _tariff_plan_for_id(
+        store, plan_data["id"], calendar, billing_cycle_type
     )
     context = tariff_plan.profile.evaluate(usage_for_billing.index)
     energy_costs = _calculate_energy_costs(
@@ -408,28 +434,77 @@ def calculate_bill(
         tariff_plan,
     )
 
-    month_index = energy_costs.index
-    monthly_usage = usage_for_billing.groupby(billing_periods).sum()
+    return _BillingPrep(
+        plan_data=plan_data,
+        store=store,
+        inputs=inputs,
+        tariff_plan=tariff_plan,
+        context=context,
+        billing_periods=billing_periods,
+        usage_for_billing=usage_for_billing,
+        energy_costs=energy_costs,
+        month_index=energy_costs.index,
+    )
+
+
+@lru_cache(maxsize=128)
+def _tariff_plan_for_id(
+    store: PlanStore,
+    plan_id: str,
+    calendar: TaiwanCalendar,
+    billing_cycle_type: BillingCycleType,
+) -> Any:
+    """Return the TariffPlan for a canonical plan ID, built once per calendar.
+
+    Entries keep their calendar alive until evicted; ``clear_plan_cache()``
+    drops them.
+    """
+    return _build_tariff_plan_from_data(
+        store.get_plan(plan_id),
+        store,
+        calendar,
+        billing_cycle_type=billing_cycle_type,
+    )
+
+
+def calculate_bill(
+    usage: pd.Series,
+    plan_id: str,
+    inputs: BillingInputs | None = None,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+    strict: bool = False,
+) -> pd.DataFrame:
+    prep = _prepare_billing(
+        usage, plan_id, inputs, calendar_instance, cache_dir, api_timeout, strict
+    )
+    plan_data = prep.plan_data
+    energy_costs = prep.energy_costs
+    monthly_usage = prep.usage_for_billing.groupby(prep.billing_periods).sum()
     monthly_usage.index = monthly_usage.index.to_timestamp()
 
-    basic_costs = _calculate_basic_fees(plan_data, inputs, month_index, store)
-    surcharge = _calculate_surcharges(plan_data, inputs, monthly_usage)
+    basic_costs = _calculate_basic_fees(
+        plan_data, prep.inputs, prep.month_index, prep.store
+    )
+    surcharge = _calculate_surcharges(plan_data, prep.inputs, monthly_usage)
     adjustment = _calculate_adjustments(
         plan_data,
-        inputs,
+        prep.inputs,
         basic_costs,
-        month_index,
-        store,
-        context,
-        billing_periods,
+        prep.month_index,
+        prep.store,
+        prep.context,
+        prep.billing_periods,
         energy_costs,
         surcharge,
     )
 
-    total = energy_costs + basic_costs + surcharge + adjustment
+    total_values = _sum_components(energy_costs, basic_costs, surcharge, adjustment)
     min_fee = _minimum_monthly_fee(plan_data)
     if min_fee is not None:
-        total = total.clip(lower=min_fee)
+        total_values = np.maximum(total_values, min_fee)
+    total = pd.Series(total_values, index=prep.month_index, copy=False)
 
     return pd.DataFrame(
         {
@@ -442,6 +517,14 @@ def calculate_bill(
     )
 
 
+def _sum_components(*components: pd.Series) -> np.ndarray:
+    """Add monthly cost Series that share one month index, without alignment."""
+    total = np.zeros(len(components[0]), dtype=np.float64)
+    for component in components:
+        total += component.to_numpy(dtype=np.float64)
+    return total
+
+
 def calculate_bill_simple(
     usage: pd.Series,
     plan_id: str,
@@ -461,68 +544,131 @@ def calculate_bill_simple(
     )
 
 
-def calculate_bill_breakdown(
-    usage: pd.Series,
+def calculate_bill_scalar(
+    usage_kwh: float,
     plan_id: str,
+    year: int,
+    month: int,
     inputs: BillingInputs | None = None,
-    calendar_instance: TaiwanCalendar | None = None,
-    cache_dir: Path | None = None,
-    api_timeout: int = 10,
     strict: bool = False,
-) -> dict[str, pd.DataFrame]:
-    if not isinstance(usage, pd.Series):
-        raise InvalidUsageInput("usage must be a pandas.Series")
-    if not isinstance(usage.index, pd.DatetimeIndex):
-        raise InvalidUsageInput("usage index must be a pandas.DatetimeIndex")
-    _validate_usage_series(usage)
+) -> dict[str, float]:
+    """Calculate one billing period for a tiered plan from total usage.
+
+    Equivalent to ``calculate_bill`` on a single reading taken on the first
+    day of ``month``, but it skips the calendar and the per-interval pandas
+    pipeline. Only non-TOU plans priced purely by consumption tiers are
+    supported.
+
+    Args:
+        usage_kwh: Total usage for the billing period in kWh
+        plan_id: The plan identifier (flexible matching supported)
+        year: Year of the billing period start
+        month: Month of the billing period start (1-12)
+        inputs: Optional billing inputs
+        strict: If True, raise errors on invalid/missing inputs
+
+    Returns:
+        Dictionary with energy_cost, basic_cost, surcharge, adjustment, total
+
+    Example:
+        result = calculate_bill_scalar(300.0, "residential_non_tou", 2025, 2)
+    """
+    usage_kwh = float(usage_kwh)
+    if not np.isfinite(usage_kwh):
+        raise InvalidUsageInput("usage values must be finite")
+    if usage_kwh < 0:
+        raise InvalidUsageInput("usage values must be non-negative")
 
     inputs = inputs or BillingInputs()
-    store = PlanStore()
+    store = _plan_store()
     plan_data = store.resolve_plan(plan_id)
+    rules = plan_data.get("billing_rules", {})
+    if not plan_data.get("tiers") or plan_data.get("rates"):
+        raise InvalidUsageInput(
+            "calculate_bill_scalar supports tiered plans only; use calculate_bill"
+        )
+    if rules.get("power_factor_adjustment") or rules.get("over_contract_penalty"):
+        raise InvalidUsageInput(
+            "calculate_bill_scalar does not apply demand or power factor "
+            "adjustments; use calculate_bill"
+        )
 
-    # Validate inputs against plan requirements
     validation_warnings = _validate_billing_inputs(plan_data, inputs, strict=strict)
     for warning in validation_warnings:
         warnings.warn(warning, UserWarning, stacklevel=2)
 
-    calendar = calendar_instance or taiwan_calendar(
-        cache_dir=cache_dir, api_timeout=api_timeout
+    if inputs.billing_cycle_months is None:
+        inputs = replace(inputs, billing_cycle_months=rules.get("billing_cycle_months"))
+
+    cycle_months = inputs.billing_cycle_months or 1
+    usage_kwh = max(
+        usage_kwh, _minimum_usage_kwh(plan_data, store, inputs) * cycle_months
     )
 
-    if inputs.billing_cycle_months is None:
-        inputs.billing_cycle_months = plan_data.get("billing_rules", {}).get(
-            "billing_cycle_months"
+    season = _season_strategy(plan_data, store).get_season(date(year, month, 1))
+    schedule = _tier_schedule(
+        tuple(ConsumptionTier(**tier) for tier in _normalize_tiers(plan_data["tiers"]))
+    )
+    energy_cost = _tiered_cost(
+        usage_kwh, schedule, _label_value(season) == SeasonType.SUMMER.value
+    )
+
+    basic_cost = 0.0
+    if plan_data.get("basic_fee") is not None or plan_data.get("basic_fees"):
+        month_index = pd.DatetimeIndex([pd.Timestamp(year, month, 1)])
+        basic_cost = float(
+            _calculate_basic_fees(plan_data, inputs, month_index, store).iloc[0]
         )
 
-    usage_for_billing = _apply_minimum_usage(plan_data, store, usage, inputs)
-    billing_periods = _billing_period_index(
-        usage_for_billing.index, inputs.billing_cycle_months
+    surcharge = 0.0
+    surcharge_rule = rules.get("over_2000_kwh_surcharge") or plan_data.get(
+        "over_2000_kwh_surcharge"
     )
+    if surcharge_rule:
+        threshold = surcharge_rule.get("threshold_kwh", 2000)
+        cost = surcharge_rule.get("cost_per_kwh", 0.0)
+        surcharge = max(usage_kwh - threshold, 0.0) * cost
 
-    # Convert billing_cycle_months to BillingCycleType
-    billing_cycle_type = BillingCycleType.MONTHLY
-    if inputs.billing_cycle_months and inputs.billing_cycle_months > 1:
-        # For bimonthly billing, default to odd-month cycle
-        # (can be overridden by adding logic to determine odd vs even)
-        billing_cycle_type = BillingCycleType.ODD_MONTH
+    total = energy_cost + basic_cost + surcharge
+    min_fee = _minimum_monthly_fee(plan_data)
+    if min_fee is not None:
+        total = max(total, min_fee)
 
-    tariff_plan = _build_tariff_plan_from_data(
-        plan_data,
-        store,
-        calendar,
-        billing_cycle_type=billing_cycle_type,
-    )
-    context = tariff_plan.profile.evaluate(usage_for_billing.index)
+    return {
+        "energy_cost": energy_cost,
+        "basic_cost": basic_cost,
+        "surcharge": surcharge,
+        "adjustment": 0.0,
+        "total": total,
+    }
 
-    energy_costs = _calculate_energy_costs(
-        usage_for_billing,
-        context,
-        billing_periods,
-        tariff_plan,
+
+def calculate_bill_breakdown(
+    usage: pd.Series,
+    plan_id: str,
+    inputs: BillingInputs | None = None,
+    calendar_instance: TaiwanCalendar | None = None,
+    cache_dir: Path | None = None,
+    api_timeout: int = 10,
+    strict: bool = False,
+) -> dict[str, pd.DataFrame]:
+    prep = _prepare_billing(
+        usage, plan_id, inputs, calendar_instance, cache_dir, api_timeout, strict
     )
-    month_index = energy_costs.index
+    plan_data = prep.plan_data
+    inputs = prep.inputs
+    store = prep.store
+    context = prep.context
+    billing_periods = prep.billing_periods
+    usage_for_billing = prep.usage_for_billing
+    energy_costs = prep.energy_costs
+    month_index = prep.month_index
 
-    monthly_usage = usage_for_billing.groupby(billing_periods).sum()
+    period_usage = usage_for_billing.groupby(
+        [billing_periods, context["season"], context["period"]]
+    ).sum()
+    # Monthly totals are a marginal of the per-period aggregation
+    monthly_usage = period_usage.groupby(level=0).sum()
     monthly_usage.index = monthly_usage.index.to_timestamp()
 
     basic_costs, basic_details = _calculate_basic_fees_breakdown(
@@ -544,13 +690,15 @@ def calculate_bill_breakdown(
         surcharge,
     )
 
-    total = energy_costs + basic_costs + surcharge + adjustment
+    total_values = _sum_components(energy_costs, basic_costs, surcharge, adjustment)
     min_fee = _minimum_monthly_fee(plan_data)
     if min_fee is not None:
-        min_adjustment = (min_fee - total).clip(lower=0.0)
-        total = total.clip(lower=min_fee)
+        min_adjustment_values = np.maximum(min_fee - total_values, 0.0)
+        total_values = np.maximum(total_values, min_fee)
     else:
-        min_adjustment = pd.Series(0.0, index=total.index)
+        min_adjustment_values = np.zeros(len(total_values), dtype=np.float64)
+    total = pd.Series(total_values, index=month_index, copy=False)
+    min_adjustment = pd.Series(min_adjustment_values, index=month_index, copy=False)
 
     summary = pd.DataFrame(
         {
@@ -563,9 +711,6 @@ def calculate_bill_breakdown(
         }
     )
 
-    period_usage = usage_for_billing.groupby(
-        [billing_periods, context["season"], context["period"]]
-    ).sum()
     period_usage.index = period_usage.index.set_names(
         ["period", "season", "period_type"]
     )
@@ -577,7 +722,7 @@ def calculate_bill_breakdown(
         usage_for_billing,
         context,
         billing_periods,
-        tariff_plan,
+        prep.tariff_plan,
     )
     period_costs = period_costs.reset_index()
     period_costs = period_costs.rename(columns={0: "energy_cost"})
@@ -599,14 +744,61 @@ def _month_season_label(
     month_index: pd.Index,
     plan_data: dict[str, Any],
     store: PlanStore,
-) -> list[str]:
-    season_strategy = _season_strategy(plan_data, store)
+) -> tuple[str, ...]:
+    months = tuple((ts.year, ts.month) for ts in month_index)
+    return _season_labels_for_months(
+        store, plan_data.get("season_strategy", "seasons"), months
+    )
+
+
+@lru_cache(maxsize=256)
+def _season_labels_for_months(
+    store: PlanStore,
+    strategy_name: str,
+    months: tuple[tuple[int, int], ...],
+) -> tuple[str, ...]:
+    """Return the season label of each (year, month), memoized per strategy.
+
+    The basic fee and adjustment helpers all ask for the same billing months,
+    so one evaluation serves every lookup in a ``calculate_bill`` call.
+    """
+    season_strategy = _season_strategy({"season_strategy": strategy_name}, store)
     labels = []
-    for ts in month_index:
-        day = date(ts.year, ts.month, 1)
-        season = season_strategy.get_season(day)
+    for year, month in months:
+        season = season_strategy.get_season(date(year, month, 1))
         labels.append(season.value if hasattr(season, "value") else str(season))
-    return labels
+    return tuple(labels)
+
+
+def _month_season_mask(
+    month_index: pd.Index,
+    plan_data: dict[str, Any],
+    store: PlanStore,
+) -> np.ndarray:
+    """Return a read-only boolean array, True for summer months."""
+    return _summer_mask(_month_season_label(month_index, plan_data, store))
+
+
+@lru_cache(maxsize=256)
+def _summer_mask(season_labels: tuple[str, ...]) -> np.ndarray:
+    mask = np.array([label == "summer" for label in season_labels], dtype=bool)
+    # The mask is shared between callers through the cache
+    mask.setflags(write=False)
+    return mask
+
+
+def _entry_rate_vector(entry: dict[str, Any], is_summer: np.ndarray) -> np.ndarray:
+    """Per-month rate of a basic fee entry; NaN where the entry has no rate."""
+    if "summer" in entry or "non_summer" in entry:
+        summer = entry.get("summer")
+        non_summer = entry.get("non_summer")
+        return np.where(
+            is_summer,
+            np.nan if summer is None else float(summer),
+            np.nan if non_summer is None else float(non_summer),
+        )
+    cost = entry.get("cost")
+    return np.full(len(is_summer), np.nan if cost is None else float(cost))
 
 
 def _calculate_basic_fees(
@@ -617,24 +809,18 @@ def _calculate_basic_fees(
 ) -> pd.Series:
     rules = plan_data.get("billing_rules", {})
     formula = rules.get("basic_fee_formula")
-    season_labels = _month_season_label(month_index, plan_data, store)
-    monthly = pd.Series(0.0, index=month_index)
     if formula and inputs.contract_capacities:
-        basic_fee_result = _basic_fee_from_formula(
+        monthly, _ = _basic_fee_from_formula(
             plan_data, inputs, month_index, store, formula, detailed=False
         )
-        # _basic_fee_from_formula always returns (monthly, details) tuple
-        monthly = (
-            basic_fee_result[0]
-            if isinstance(basic_fee_result, tuple)
-            else basic_fee_result
-        )
     else:
+        acc = np.zeros(len(month_index), dtype=np.float64)
         basic_fee = plan_data.get("basic_fee")
         if basic_fee is not None:
             count = inputs.basic_fee_inputs.get("basic_fee", 1.0)
-            monthly += float(basic_fee) * count
+            acc += float(basic_fee) * count
 
+        is_summer = _month_season_mask(month_index, plan_data, store)
         for entry in plan_data.get("basic_fees", []):
             label = entry.get("label", "")
             unit = entry.get("unit", "")
@@ -644,18 +830,10 @@ def _calculate_basic_fees(
                 quantity = inputs.basic_fee_inputs.get(label, 0.0)
             if quantity == 0:
                 continue
-            for idx, season_label in enumerate(season_labels):
-                if "summer" in entry or "non_summer" in entry:
-                    rate = (
-                        entry.get("summer")
-                        if season_label == "summer"
-                        else entry.get("non_summer")
-                    )
-                else:
-                    rate = entry.get("cost")
-                if rate is None:
-                    continue
-                monthly.iloc[idx] += float(rate) * quantity
+            rates = _entry_rate_vector(entry, is_summer)
+            has_rate = ~np.isnan(rates)
+            acc += np.where(has_rate, rates * quantity, 0.0)
+        monthly = pd.Series(acc, index=month_index, copy=False)
 
     if inputs.billing_cycle_months and inputs.billing_cycle_months > 1:
         monthly = monthly * inputs.billing_cycle_months
@@ -663,6 +841,9 @@ def _calculate_basic_fees(
     return monthly
 
 
+_BASIC_DETAIL_COLUMNS = ("period", "label", "quantity", "rate", "cost")
+
+
 def _calculate_basic_fees_breakdown(
     plan_data: dict[str, Any],
     inputs: BillingInputs,
@@ -671,9 +852,8 @@ def _calculate_basic_fees_breakdown(
 ) -> tuple[pd.Series, pd.DataFrame]:
     rules = plan_data.get("billing_rules", {})
     formula = rules.get("basic_fee_formula")
-    season_labels = _month_season_label(month_index, plan_data, store)
-    monthly = pd.Series(0.0, index=month_index)
-    details: list[dict[str, Any]] = []
+    acc = np.zeros(len(month_index), dtype=np.float64)
+    detail_frames: list[pd.DataFrame] = []
 
     if formula and inputs.contract_capacities:
         base_series, base_details = _basic_fee_from_formula(
@@ -684,25 +864,22 @@ def _calculate_basic_fees_breakdown(
             formula,
             detailed=True,
         )
-        monthly += base_series
-        details.extend(base_details)
+        acc += base_series.to_numpy(dtype=np.float64)
+        if base_details:
+            detail_frames.append(pd.DataFrame(base_details))
     else:
         basic_fee = plan_data.get("basic_fee")
         if basic_fee is not None:
             count = inputs.basic_fee_inputs.get("basic_fee", 1.0)
             value = float(basic_fee) * count
-            monthly += value
-            for ts in month_index:
-                details.append(
-                    {
-                        "period": ts,
-                        "label": "basic_fee",
-                        "quantity": count,
-                        "rate": float(basic_fee),
-                        "cost": value,
-                    }
+            acc += value
+            detail_frames.append(
+                _basic_fee_detail_frame(
+                    month_index, "basic_fee", count, float(basic_fee), value
                 )
+            )
 
+        is_summer = _month_season_mask(month_index, plan_data, store)
         for entry in plan_data.get("basic_fees", []):
             label = entry.get("label", "")
             unit = entry.get("unit", "")
@@ -712,35 +889,54 @@ def _calculate_basic_fees_breakdown(
                 quantity = inputs.basic_fee_inputs.get(label, 0.0)
             if quantity == 0:
                 continue
-            for idx, season_label in enumerate(season_labels):
-                if "summer" in entry or "non_summer" in entry:
-                    rate = (
-                        entry.get("summer")
-                        if season_label == "summer"
-                        else entry.get("non_summer")
-                    )
-                else:
-                    rate = entry.get("cost")
-                if rate is None:
-                    continue
-                cost = float(rate) * quantity
-                monthly.iloc[idx] += cost
-                details.append(
-                    {
-                        "period": month_index[idx],
-                        "label": label,
-                        "quantity": quantity,
-                        "rate": float(rate),
-                        "cost": cost,
-                    }
+            rates = _entry_rate_vector(entry, is_summer)
+            has_rate = ~np.isnan(rates)
+            costs = rates * quantity
+            acc += np.where(has_rate, costs, 0.0)
+            # Months without a rate for this entry get no detail row
+            if not has_rate.any():
+                continue
+            detail_frames.append(
+                _basic_fee_detail_frame(
+                    month_index[has_rate],
+                    label,
+                    quantity,
+                    rates[has_rate],
+                    costs[has_rate],
                 )
+            )
+
+    monthly = pd.Series(acc, index=month_index, copy=False)
+    if not detail_frames:
+        details = pd.DataFrame(columns=list(_BASIC_DETAIL_COLUMNS))
+    else:
+        details = pd.concat(detail_frames, ignore_index=True)
 
     if inputs.billing_cycle_months and inputs.billing_cycle_months > 1:
         monthly = monthly * inputs.billing_cycle_months
-        for item in details:
-            item["cost"] = float(item["cost"]) * inputs.billing_cycle_months
+        details["cost"] = details["cost"].astype(float) * inputs.billing_cycle_months
 
-    return monthly, pd.DataFrame(details)
+    return monthly, details
+
+
+def _basic_fee_detail_frame(
+    periods: pd.Index,
+    label: str,
+    quantity: float,
+    rate: float | np.ndarray,
+    cost: float | np.ndarray,
+) -> pd.DataFrame:
+    """Build basic fee detail rows for ``periods``; scalars are broadcast."""
+    n = len(periods)
+    return pd.DataFrame(
+        {
+            "period": periods,
+            "label": np.full(n, label, dtype=object),
+            "quantity": np.full(n, quantity),
+            "rate": np.full(n, rate, dtype=np.float64),
+            "cost": np.full(n, cost, dtype=np.float64),
+        }
+    )
 
 
 def _calculate_surcharges(
@@ -752,13 +948,13 @@ def _calculate_surcharges(
     rule = rules.get("over_2000_kwh_surcharge") or plan_data.get(
         "over_2000_kwh_surcharge"
     )
-    surcharge = pd.Series(0.0, index=monthly_usage.index)
+    surcharge = np.zeros(len(monthly_usage), dtype=np.float64)
     if rule:
         threshold = rule.get("threshold_kwh", 2000)
         cost = rule.get("cost_per_kwh", 0.0)
-        over = (monthly_usage - threshold).clip(lower=0.0)
-        surcharge += over * cost
-    return surcharge
+        usage = monthly_usage.to_numpy(dtype=np.float64)
+        surcharge += np.maximum(usage - threshold, 0.0) * cost
+    return pd.Series(surcharge, index=monthly_usage.index, copy=False)
 
 
 def _calculate_adjustments(
@@ -782,6 +978,7 @@ def _calculate_adjustments(
         billing_periods,
         energy_costs,
         surcharge,
+        detailed=False,
     )[0]
 
 
@@ -795,12 +992,22 @@ def _calculate_adjustments_breakdown(
     billing_periods: pd.PeriodIndex,
     energy_costs: pd.Series,
     surcharge: pd.Series,
+    detailed: bool = True,
 ) -> tuple[pd.Series, pd.DataFrame]:
-    rules = plan_data.get("billing_rules", {})
-    adjustment = pd.Series(0.0, index=month_index)
-    details: list[dict[str, Any]] = []
+    """Return monthly adjustments and, when ``detailed``, their detail rows.
 
+    With ``detailed=False`` no detail rows are built and the returned
+    DataFrame is empty.
+    """
+    rules = plan_data.get("billing_rules", {})
     pf_rule = rules.get("power_factor_adjustment")
+    oc_rule = rules.get("over_contract_penalty")
+    adjustment = np.zeros(len(month_index), dtype=np.float64)
+    if not oc_rule and not (pf_rule and inputs.power_factor is not None):
+        # Most residential and lighting plans carry no adjustment rules
+        return pd.Series(adjustment, index=month_index, copy=False), pd.DataFrame()
+
+    details: list[dict[str, Any]] = []
     if pf_rule and inputs.power_factor is not None:
         base = pf_rule.get("base_percent", 80)
         max_discount = pf_rule.get("max_discount_percent", 95)
@@ -813,33 +1020,26 @@ def _calculate_adjustments_breakdown(
             target = energy_costs
         else:
             target = basic_costs
+        # Surcharge below the base power factor, discount (capped) above it
+        ratio = None
         if pf < base:
-            delta = base - pf
-            delta_cost = target * (delta * step / 100.0)
-            adjustment += delta_cost
-            for idx, value in delta_cost.items():
-                details.append(
-                    {
-                        "period": idx,
-                        "type": "power_factor",
-                        "amount": float(value),
-                    }
-                )
+            ratio = (base - pf) * step / 100.0
         elif pf > base:
-            cap = min(pf, max_discount)
-            delta = cap - base
-            delta_cost = -target * (delta * step / 100.0)
+            ratio = -(min(pf, max_discount) - base) * step / 100.0
+        if ratio is not None:
+            # target is indexed by month_index, so it adds positionally
+            delta_cost = target.to_numpy(dtype=np.float64) * ratio
             adjustment += delta_cost
-            for idx, value in delta_cost.items():
-                details.append(
+            if detailed:
+                details.extend(
                     {
                         "period": idx,
                         "type": "power_factor",
-                        "amount": float(value),
+                        "amount": value,
                     }
+                    for idx, value in zip(month_index, delta_cost.tolist())
                 )
 
-    oc_rule = rules.get("over_contract_penalty")
     if oc_rule:
         base_label = oc_rule.get("base_fee_label", "經常契約")
         base_rate = _basic_fee_rate_for_label(plan_data, base_label, month_index, store)
@@ -854,26 +1054,33 @@ def _calculate_adjustments_breakdown(
                 threshold_ratio = oc_rule.get("threshold_ratio", 0.10)
                 rate_low = oc_rule.get("rate_low", 2)
                 rate_high = oc_rule.get("rate_high", 3)
-                for idx, over in over_series.items():
-                    contract_kw = (
-                        inputs.contract_capacity_kw
-                        or inputs.contract_capacities.get("regular", 0.0)
-                    )
-                    threshold = contract_kw * threshold_ratio
-                    over_low = min(over, threshold)
-                    over_high = max(0.0, over - threshold)
-                    amount = base_rate.loc[idx] * over_low * rate_low
-                    amount += base_rate.loc[idx] * over_high * rate_high
-                    adjustment.loc[idx] += amount
-                    details.append(
+                contract_kw = inputs.contract_capacity_kw or (
+                    inputs.contract_capacities.get("regular", 0.0)
+                )
+                threshold = contract_kw * threshold_ratio
+                over = over_series.to_numpy(dtype=np.float64)
+                over_low = np.minimum(over, threshold)
+                over_high = np.maximum(over - threshold, 0.0)
+                positions = month_index.get_indexer(over_series.index)
+                if (positions < 0).any():
+                    # get_indexer marks unknown labels with -1; fail like .loc
+                    missing = over_series.index[positions < 0]
+                    raise KeyError(f"Periods not in billing months: {list(missing)}")
+                rate = base_rate.to_numpy(dtype=np.float64)[positions]
+                amounts = rate * over_low * rate_low + rate * over_high * rate_high
+                adjustment[positions] += amounts
+                if detailed:
+                    details.extend(
                         {
                             "period": idx,
                             "type": "over_contract",
-                            "amount": float(amount),
+                            "amount": amount,
                         }
+                        for idx, amount in zip(over_series.index, amounts.tolist())
                     )
 
-    return adjustment, pd.DataFrame(details)
+    adjustment_series = pd.Series(adjustment, index=month_index, copy=False)
+    return adjustment_series, pd.DataFrame(details)
 
 
 def _basic_fee_rate_for_label(
@@ -886,19 +1093,10 @@ def _basic_fee_rate_for_label(
     entry = next((e for e in entries if e.get("label") == label), None)
     if not entry:
         return None
-    season_labels = _month_season_label(month_index, plan_data, store)
-    rates = []
-    for season_label in season_labels:
-        if "summer" in entry or "non_summer" in entry:
-            rate = (
-                entry.get("summer")
-                if season_label == "summer"
-                else entry.get("non_summer")
-            )
-        else:
-            rate = entry.get("cost")
-        rates.append(float(rate) if rate is not None else 0.0)
-    return pd.Series(rates, index=month_index)
+    is_summer = _month_season_mask(month_index, plan_data, store)
+    rates = _entry_rate_vector(entry, is_summer)
+    # A missing rate counts as zero here
+    return pd.Series(np.nan_to_num(rates, nan=0.0), index=month_index)
 
 
 def _basic_fee_from_formula(
@@ -909,9 +1107,9 @@ def _basic_fee_from_formula(
     formula: dict[str, Any],
     detailed: bool = False,
 ) -> tuple[pd.Series, list[dict[str, Any]]]:
-    season_labels = _month_season_label(month_index, plan_data, store)
+    is_summer = _month_season_mask(month_index, plan_data, store)
     rates = {entry["label"]: entry for entry in plan_data.get("basic_fees", [])}
-    monthly = pd.Series(0.0, index=month_index)
+    monthly = np.zeros(len(month_index), dtype=np.float64)
     details: list[dict[str, Any]] = []
     capacities = inputs.contract_capacities
     weekend_ratio = float(formula.get("weekend_ratio", 0.5))
@@ -934,24 +1132,20 @@ def _basic_fee_from_formula(
                         }
                     )
 
-    def _season_rate(label: str, season_label: str) -> float:
+    def _season_rate(label: str, summer: bool) -> float:
         entry = rates.get(label, {})
         if "summer" in entry or "non_summer" in entry:
-            rate = (
-                entry.get("summer")
-                if season_label == "summer"
-                else entry.get("non_summer")
-            )
+            rate = entry.get("summer") if summer else entry.get("non_summer")
             return float(rate) if rate is not None else 0.0
         rate = entry.get("cost")
         return float(rate) if rate is not None else 0.0
 
-    for idx, season_label in enumerate(season_labels):
+    for idx, summer in enumerate(is_summer.tolist()):
         if formula["type"] == "regular_only":
-            rate = _season_rate(formula["regular_label"], season_label)
+            rate = _season_rate(formula["regular_label"], summer)
             quantity = capacities.get("regular", 0.0)
             cost = rate * quantity
-            monthly.iloc[idx] += cost
+            monthly[idx] += cost
             if detailed:
                 details.append(
                     {
@@ -965,9 +1159,9 @@ def _basic_fee_from_formula(
             continue
 
         if formula["type"] == "two_stage":
-            regular_rate = _season_rate(formula["regular_label"], season_label)
-            non_summer_rate = _season_rate(formula["non_summer_label"], season_label)
-            saturday_rate = _season_rate(formula["saturday_label"], season_label)
+            regular_rate = _season_rate(formula["regular_label"], summer)
+            non_summer_rate = _season_rate(formula["non_summer_label"], summer)
+            saturday_rate = _season_rate(formula["saturday_label"], summer)
             regular = capacities.get("regular", 0.0)
             non_summer = capacities.get("non_summer", 0.0)
             saturday = capacities.get("saturday_semi_peak", 0.0)
@@ -978,10 +1172,10 @@ def _basic_fee_from_formula(
             ) * weekend_ratio
             weekend_base = max(0.0, weekend_base)
 
-            if season_label == "summer":
+            if summer:
                 cost_regular = regular_rate * regular
                 cost_weekend = saturday_rate * weekend_base
-                monthly.iloc[idx] += cost_regular + cost_weekend
+                monthly[idx] += cost_regular + cost_weekend
                 if detailed:
                     details.append(
                         {
@@ -1005,7 +1199,7 @@ def _basic_fee_from_formula(
                 cost_regular = regular_rate * regular
                 cost_non_summer = non_summer_rate * non_summer
                 cost_weekend = saturday_rate * weekend_base
-                monthly.iloc[idx] += cost_regular + cost_non_summer + cost_weekend
+                monthly[idx] += cost_regular + cost_non_summer + cost_weekend
                 if detailed:
                     details.append(
                         {
@@ -1037,9 +1231,9 @@ def _basic_fee_from_formula(
             continue
 
         if formula["type"] == "three_stage":
-            regular_rate = _season_rate(formula["regular_label"], season_label)
-            semi_rate = _season_rate(formula["semi_peak_label"], season_label)
-            saturday_rate = _season_rate(formula["saturday_label"], season_label)
+            regular_rate = _season_rate(formula["regular_label"], summer)
+            semi_rate = _season_rate(formula["semi_peak_label"], summer)
+            saturday_rate = _season_rate(formula["saturday_label"], summer)
             regular = capacities.get("regular", 0.0)
             semi_peak = capacities.get("semi_peak", 0.0)
             saturday = capacities.get("saturday_semi_peak", 0.0)
@@ -1051,7 +1245,7 @@ def _basic_fee_from_formula(
             cost_regular = regular_rate * regular
             cost_semi = semi_rate * semi_peak
             cost_weekend = saturday_rate * weekend_base
-            monthly.iloc[idx] += cost_regular + cost_semi + cost_weekend
+            monthly[idx] += cost_regular + cost_semi + cost_weekend
             if detailed:
                 details.append(
                     {
@@ -1081,7 +1275,7 @@ def _basic_fee_from_formula(
                     }
                 )
 
-    return monthly, details
+    return pd.Series(monthly, index=month_index, copy=False), details
 
 
 def _minimum_monthly_fee(plan_data: dict[str, Any]) -> float | None:
@@ -1092,27 +1286,27 @@ def _minimum_monthly_fee(plan_data: dict[str, Any]) -> float | None:
     return float(value)
 
 
-def _apply_minimum_usage(
+def _minimum_usage_kwh(
     plan_data: dict[str, Any],
     store: PlanStore,
-    usage: pd.Series,
     inputs: BillingInputs,
-) -> pd.Series:
+) -> float:
+    """Return the plan's minimum monthly kWh for the meter, or 0.0 if none."""
     rules = plan_data.get("billing_rules", {})
     ref = rules.get("minimum_usage_rules_ref")
     if not ref:
-        return usage
+        return 0.0
     if (
         inputs.meter_phase is None
         or inputs.meter_voltage_v is None
         or inputs.meter_ampere is None
     ):
-        return usage
+        return 0.0
 
     definitions = store.definitions()
     ruleset = definitions.get("minimum_usage_rules", {}).get(ref, [])
     if not ruleset:
-        return usage
+        return 0.0
 
     target = None
     for item in ruleset:
@@ -1124,18 +1318,24 @@ def _apply_minimum_usage(
         break
 
     if not target:
-        return usage
+        return 0.0
 
     ampere = float(inputs.meter_ampere)
     if "ampere_threshold" in target:
         threshold = target["ampere_threshold"]
         if ampere <= threshold:
-            min_kwh = ampere * target["kwh_per_ampere"]
-        else:
-            min_kwh = ampere * target["kwh_per_ampere_over"]
-    else:
-        min_kwh = ampere * target["kwh_per_ampere"]
+            return ampere * target["kwh_per_ampere"]
+        return ampere * target["kwh_per_ampere_over"]
+    return ampere * target["kwh_per_ampere"]
 
+
+def _apply_minimum_usage(
+    plan_data: dict[str, Any],
+    store: PlanStore,
+    usage: pd.Series,
+    inputs: BillingInputs,
+) -> pd.Series:
+    min_kwh = _minimum_usage_kwh(plan_data, store, inputs)
     if min_kwh <= 0:
         return usage
 
@@ -1338,13 +1538,14 @@ def _calculate_energy_costs(
     if rates.tiered_rates:
         totals = {}
         for period, group in usage.groupby(billing_periods):
-            if group.sum() == 0:
+            group_kwh = _total_kwh(group)
+            if group_kwh == 0:
                 totals[period.to_timestamp()] = 0.0
                 continue
             season = context_df.loc[group.index, "season"].mode().iloc[0]
             season_label = season.value if hasattr(season, "value") else str(season)
             totals[period.to_timestamp()] = _tiered_total_cost(
-                group.sum(),
+                group_kwh,
                 season_label,
                 rates.tiered_rates,
             )
@@ -1369,26 +1570,11 @@ def _tiered_total_cost(
     season_label: str,
     tiers: list[Any],
 ) -> float:
-    if total_usage_kwh == 0:
-        return 0.0
-    sorted_tiers = sorted(tiers, key=lambda x: x.start_kwh)
-    remaining_kwh = total_usage_kwh
-    total_cost = 0.0
-    last_limit_kwh = 0.0
-    for tier in sorted_tiers:
-        if remaining_kwh <= 0:
-            break
-        tier_limit_kwh = (
-            (tier.end_kwh - last_limit_kwh) if tier.end_kwh < 999999 else float("inf")
-        )
-        usage_in_tier_kwh = min(remaining_kwh, tier_limit_kwh)
-        unit_cost = (
-            tier.summer_cost if season_label == "summer" else tier.non_summer_cost
-        )
-        total_cost += usage_in_tier_kwh * unit_cost
-        remaining_kwh -= usage_in_tier_kwh
-        last_limit_kwh = tier.end_kwh
-    return total_cost
+    return _tiered_cost(
+        total_usage_kwh,
+        _tier_schedule(tuple(tiers)),
+        season_label == "summer",
+    )
 
 
 def _calculate_period_costs(
@@ -1432,7 +1618,9 @@ def _calculate_period_costs(
         grouped = costs.groupby(
             [month_context["season"], month_context["period"]]
         ).sum()
-        for (season, period_type), cost in grouped.items():
+        for (season, period_type), cost in zip(
+            grouped.index, grouped.to_numpy(dtype=np.float64).tolist()
+        ):
             season_label = season.value if hasattr(season, "value") else str(season)
             period_label = (
                 period_type.value if hasattr(period_type, "value") else str(period_type)
@@ -1442,7 +1630,7 @@ def _calculate_period_costs(
                     "period": period.to_timestamp(),
                     "season": season_label,
                     "period_type": period_label,
-                    "energy_cost": float(cost),
+                    "energy_cost": cost,
                 }
             )
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import time
 from datetime import date, datetime
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
@@ -315,6 +315,28 @@ class TaiwanCalendar:
 
 
 def taiwan_calendar(
-    cache_dir: Path | None = None, api_timeout: int = 10
+    cache_dir: str | Path | None = None, api_timeout: int = 10
 ) -> TaiwanCalendar:
+    """Return the shared TaiwanCalendar for these settings.
+
+    Calendars are cached per (cache_dir, api_timeout), so holidays loaded by
+    one caller are reused by the next. Equivalent settings share one calendar
+    however they are spelled (positional or keyword, ``str`` or ``Path``).
+    Call `clear_calendar_cache()` to start from fresh instances.
+    """
+    # TaiwanCalendar treats any falsy cache_dir as the default location
+    return _shared_calendar(Path(cache_dir) if cache_dir else None, api_timeout)
+
+
+@lru_cache(maxsize=32)
+def _shared_calendar(cache_dir: Path | None, api_timeout: int) -> TaiwanCalendar:
     return TaiwanCalendar(cache_dir=cache_dir, api_timeout=api_timeout)
+
+
+def clear_calendar_cache() -> None:
+    """Drop the calendars shared by `taiwan_calendar()`.
+
+    Later calls build new instances, which reload holidays from the disk
+    cache or the API instead of keeping an earlier lunar fallback.
+    """
+    _shared_calendar.cache_clear()
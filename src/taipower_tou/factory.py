@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from taipower_tou.calendar import TaiwanCalendar, taiwan_calendar
@@ -16,33 +18,37 @@ from taipower_tou.models import BillingCycleType
 from taipower_tou.rates import TariffJSONLoader
 from taipower_tou.tariff import TaiwanDayTypeStrategy, TaiwanSeasonStrategy
 
-# Shared plan ID to Chinese name mapping
-# Used by both PlanStore.resolve_plan() and available_plans()
-_PLAN_NAME_MAP: dict[str, str] = {
-    "residential_non_tou": "表燈非時間電價",
-    "lighting_non_business_tiered": "表燈非時間-住宅非營業",
-    "lighting_business_tiered": "表燈非時間-營業用",
-    "residential_simple_2_tier": "簡易型二段式",
-    "residential_simple_3_tier": "簡易型三段式",
-    "lighting_standard_2_tier": "標準型二段式",
-    "lighting_standard_3_tier": "標準型三段式",
-    "low_voltage_power": "低壓電力非時間",
-    "low_voltage_2_tier": "低壓電力二段式",
-    "low_voltage_three_stage": "低壓電力三段式",
-    "low_voltage_ev": "低壓電動車",
-    "high_voltage_power": "高壓電力",
-    "high_voltage_2_tier": "高壓電力二段式",
-    "high_voltage_three_stage": "高壓電力三段式",
-    "high_voltage_batch": "高壓批次生產",
-    "high_voltage_ev": "高壓電動車",
-    "extra_high_voltage_power": "特高壓電力",
-    "extra_high_voltage_2_tier": "特高壓電力二段式",
-    "extra_high_voltage_three_stage": "特高壓電力三段式",
-    "extra_high_voltage_batch": "特高壓批次生產",
-}
+# Shared plan ID to Chinese name mapping, read-only since it is built once
+# Used by both PlanStore.resolve_plan_id() and available_plans()
+_PLAN_NAME_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "residential_non_tou": "表燈非時間電價",
+        "lighting_non_business_tiered": "表燈非時間-住宅非營業",
+        "lighting_business_tiered": "表燈非時間-營業用",
+        "residential_simple_2_tier": "簡易型二段式",
+        "residential_simple_3_tier": "簡易型三段式",
+        "lighting_standard_2_tier": "標準型二段式",
+        "lighting_standard_3_tier": "標準型三段式",
+        "low_voltage_power": "低壓電力非時間",
+        "low_voltage_2_tier": "低壓電力二段式",
+        "low_voltage_three_stage": "低壓電力三段式",
+        "low_voltage_ev": "低壓電動車",
+        "high_voltage_power": "高壓電力",
+        "high_voltage_2_tier": "高壓電力二段式",
+        "high_voltage_three_stage": "高壓電力三段式",
+        "high_voltage_batch": "高壓批次生產",
+        "high_voltage_ev": "高壓電動車",
+        "extra_high_voltage_power": "特高壓電力",
+        "extra_high_voltage_2_tier": "特高壓電力二段式",
+        "extra_high_voltage_three_stage": "特高壓電力三段式",
+        "extra_high_voltage_batch": "特高壓批次生產",
+    }
+)
 
 # Reverse mapping for Chinese name to plan ID lookup
-_CHINESE_NAME_MAP: dict[str, str] = {v: k for k, v in _PLAN_NAME_MAP.items()}
+_CHINESE_NAME_MAP: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in _PLAN_NAME_MAP.items()}
+)
 
 
 @dataclass
@@ -113,20 +119,48 @@ class PlanStore:
     def __init__(self, filename: str = "plans.json") -> None:
         self._loader = TariffJSONLoader(filename=filename)
         self._data: dict[str, Any] | None = None
+        self._plans_by_id: dict[str, dict[str, Any]] | None = None
+        self._search_keys: tuple[tuple[str, str, str], ...] | None = None
+        self._plan_ids: tuple[str, ...] | None = None
+        self._resolved_ids: dict[str, str] = {}
 
     def _load(self) -> dict[str, Any]:
         if self._data is None:
             self._data = self._loader.load()
         return self._data
 
+    def _plan_index(self) -> dict[str, dict[str, Any]]:
+        """Return plans keyed by ID, built once per store."""
+        if self._plans_by_id is None:
+            index: dict[str, dict[str, Any]] = {}
+            for plan in self._load().get("plans", []):
+                # Keep the first plan for a repeated ID, as a linear scan would
+                index.setdefault(plan.get("id"), plan)
+            self._plans_by_id = index
+        return self._plans_by_id
+
+    def _partial_match_keys(self) -> tuple[tuple[str, str, str], ...]:
+        """Return (plan_id, lowercase plan_id, name) for partial matching."""
+        if self._search_keys is None:
+            keys = []
+            for plan in self._load().get("plans", []):
+                pid = plan.get("id", "")
+                keys.append((pid, pid.lower(), plan.get("name", "")))
+            self._search_keys = tuple(keys)
+        return self._search_keys
+
+    def __contains__(self, plan_id: object) -> bool:
+        """Return True if ``plan_id`` is an exact (canonical) plan ID."""
+        return plan_id in self._plan_index()
+
     def definitions(self) -> dict[str, Any]:
         return self._load().get("definitions", {})
 
     def get_plan(self, plan_id: str) -> dict[str, Any]:
-        for plan in self._load().get("plans", []):
-            if plan.get("id") == plan_id:
-                return plan
-        raise KeyError(f"Plan not found: {plan_id}")
+        plan = self._plan_index().get(plan_id)
+        if plan is None:
+            raise KeyError(f"Plan not found: {plan_id}")
+        return plan
 
     def resolve_plan(self, plan_id: str) -> dict[str, Any]:
         """Resolve plan ID with flexible matching.
@@ -145,35 +179,47 @@ class PlanStore:
         Raises:
             KeyError: If no matching plan is found
         """
+        return dict(self.get_plan(self.resolve_plan_id(plan_id)))
+
+    def resolve_plan_id(self, plan_id: str) -> str:
+        """Return the canonical plan ID for a name accepted by resolve_plan.
+
+        Results are memoized per store, so repeated lookups of the same name
+        skip the Chinese-name and partial matching steps.
+
+        Raises:
+            KeyError: If no matching plan is found
+        """
+        resolved = self._resolved_ids.get(plan_id)
+        if resolved is None:
+            resolved = self._match_plan_id(plan_id)
+            self._resolved_ids[plan_id] = resolved
+        return resolved
+
+    def _match_plan_id(self, plan_id: str) -> str:
         # Try exact match first
-        try:
-            return dict(self.get_plan(plan_id))
-        except KeyError:
-            pass
+        if plan_id in self:
+            return plan_id
 
         # Try Chinese name mapping (using shared map)
         mapped_id = _CHINESE_NAME_MAP.get(plan_id.strip())
         if mapped_id:
-            return dict(self.get_plan(mapped_id))
+            self.get_plan(mapped_id)  # Raises if the mapped plan is missing
+            return mapped_id
 
-        # Try partial matching by checking plan names in JSON
+        # Try partial matching: query is a substring of an ID or a name
         plan_id_lower = plan_id.lower()
-        all_plans = self._load().get("plans", [])
-        matches = []
-
-        for plan in all_plans:
-            pid = plan.get("id", "")
-            name = plan.get("name", "")
-
-            # Check if query is substring of ID or name
-            if plan_id_lower in pid.lower() or plan_id_lower in name:
-                matches.append((pid, plan))
+        matches = [
+            pid
+            for pid, pid_lower, name in self._partial_match_keys()
+            if plan_id_lower in pid_lower or plan_id_lower in name
+        ]
 
         if len(matches) == 1:
-            return dict(matches[0][1])
+            return matches[0]
 
         if len(matches) > 1:
-            match_ids = ", ".join(m[0] for m in matches)
+            match_ids = ", ".join(matches)
             raise KeyError(
                 f"Ambiguous plan name '{plan_id}'. "
                 f"Multiple matches: {match_ids}. "
@@ -185,11 +231,22 @@ class PlanStore:
             f"Use available_plans() to list all valid plan IDs."
         )
 
-    @lru_cache(maxsize=1)
     def list_plan_ids(self) -> tuple[str, ...]:
         """Return tuple of all available plan IDs."""
-        plans = self._load().get("plans", [])
-        return tuple(p.get("id", "") for p in plans if p.get("id"))
+        if self._plan_ids is None:
+            plans = self._load().get("plans", [])
+            self._plan_ids = tuple(p.get("id", "") for p in plans if p.get("id"))
+        return self._plan_ids
+
+
+@lru_cache(maxsize=1)
+def _plan_store() -> PlanStore:
+    """Return the process-wide PlanStore for the bundled plans.json.
+
+    Sharing one store means the JSON is parsed once and its ID index and
+    name resolutions are reused by every caller. Plan data is read-only.
+    """
+    return PlanStore()
 
 
 class TariffFactory:
@@ -201,7 +258,7 @@ class TariffFactory:
         store: PlanStore | None = None,
     ) -> None:
         self._calendar = calendar or taiwan_calendar()
-        self._store = store or PlanStore()
+        self._store = store or _plan_store()
 
     def create_plan(
         self,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import functools
 from datetime import date, datetime, time
-from typing import Any, Protocol
+from typing import Any, NamedTuple, Protocol
 
 try:
     import numpy as np
@@ -219,29 +219,56 @@ class _TariffEngine:
                     self._lookup_table[s_idx, d_idx, start_min:] = p_idx
                     self._lookup_table[s_idx, d_idx, :end_min] = p_idx
 
-    def evaluate(self, index: pd.DatetimeIndex) -> pd.DataFrame:
+    def evaluate(
+        self,
+        index: pd.DatetimeIndex,
+        day_context: tuple[pd.Index, pd.Index] | None = None,
+    ) -> pd.DataFrame:
         if pd is None or np is None:
             raise ImportError("pandas and numpy are required for vectorized lookup")
         if not isinstance(index, pd.DatetimeIndex):
             raise TypeError("Index must be a pandas.DatetimeIndex")
 
+        if day_context is None:
+            day_context = self.classify_days(index)
+        season_objs, day_type_objs = day_context
+
+        season_series = pd.Series(season_objs, index=index, name="season")
+        season_codes = (
+            season_objs.map(self._season_map).fillna(0).astype(np.int8).values
+        )
+        day_type_series = pd.Series(day_type_objs, index=index, name="day_type")
+        day_type_codes = (
+            day_type_objs.map(self._day_type_map).fillna(0).astype(np.int8).values
+        )
+
+        minutes = index.hour * 60 + index.minute
+        period_codes = self._lookup_table[season_codes, day_type_codes, minutes]
+        period_objs = np.array(self._period_types)[period_codes]
+        period_series = pd.Series(period_objs, index=index, name="period")
+
+        return pd.concat([season_series, day_type_series, period_series], axis=1)
+
+    def classify_days(self, index: pd.DatetimeIndex) -> tuple[pd.Index, pd.Index]:
+        """Return the season and day type of every timestamp in ``index``.
+
+        The result depends only on the profile's strategies, so profiles whose
+        strategies share a ``_strategy_key`` can reuse it via ``evaluate``.
+        """
         # Preload all years for batch calendar optimization
         unique_years = index.year.unique()
         years_set = {int(y) for y in unique_years}
         self._preload_calendar_years(years_set)
 
-        unique_dates = pd.Series(index.normalize().unique())
+        normalized = index.normalize()
+        unique_dates = pd.Series(normalized.unique())
 
         # Season mapping (fast - no calendar needed)
         date_to_season = unique_dates.dt.date.apply(
             self.profile.season_strategy.get_season
         )
         season_map = dict(zip(unique_dates, date_to_season))
-        season_objs = index.normalize().map(season_map)
-        season_series = pd.Series(season_objs, index=index, name="season")
-        season_codes = (
-            season_objs.map(self._season_map).fillna(0).astype(np.int8).values
-        )
+        season_objs = normalized.map(season_map)
 
         # Day type mapping - use batch method for vectorized calendar lookup
         day_type_strategy = self.profile.day_type_strategy
@@ -251,19 +278,8 @@ class _TariffEngine:
             date_to_day_type = {
                 dt: day_type_strategy.get_day_type(dt) for dt in unique_dates.dt.date
             }
-        day_type_map = date_to_day_type
-        day_type_objs = index.normalize().map(day_type_map)
-        day_type_series = pd.Series(day_type_objs, index=index, name="day_type")
-        day_type_codes = (
-            day_type_objs.map(self._day_type_map).fillna(0).astype(np.int8).values
-        )
-
-        minutes = index.hour * 60 + index.minute
-        period_codes = self._lookup_table[season_codes, day_type_codes, minutes]
-        period_objs = np.array(self._period_types)[period_codes]
-        period_series = pd.Series(period_objs, index=index, name="period")
-
-        return pd.concat([season_series, day_type_series, period_series], axis=1)
+        day_type_objs = normalized.map(date_to_day_type)
+        return season_objs, day_type_objs
 
     def _preload_calendar_years(self, years: set[int]) -> None:
         """Preload calendar data for all years in batch for optimization."""
@@ -341,6 +357,10 @@ if pd is not None:
 
 
 class TariffPlan:
+    # plan() builds a new plan per call over cached parts; slots keep it cheap.
+    # __weakref__ keeps plans weak-referenceable, as they were without slots.
+    __slots__ = ("profile", "rates", "billing_cycle_type", "__weakref__")
+
     def __init__(
         self,
         profile: TariffProfile,
@@ -450,17 +470,39 @@ class TariffPlan:
             raise TariffError("pandas is required for cost calculation")
         _validate_usage_series(usage_kwh)
 
+        return self._costs_from_context(
+            usage_kwh, self.profile.evaluate(usage_kwh.index)
+        )
+
+    def calculate_cost_scalar(self, when: datetime, usage_kwh: float) -> float:
+        """Return the energy cost of ``usage_kwh`` consumed at ``when``.
+
+        Scalar counterpart of ``calculate_costs`` for a single interval; it
+        looks up the period directly instead of building a pandas Series.
+        Tiered plans price monthly totals, so they are rejected here.
+        """
         if self.rates.tiered_rates:
-            return self._calculate_tiered_costs(usage_kwh)
+            raise InvalidUsageInput(
+                "scalar costs are not supported for tiered plans; "
+                "use calculate_costs for monthly billing totals."
+            )
+        usage = float(usage_kwh)
+        if not np.isfinite(usage):
+            raise InvalidUsageInput("usage values must be finite")
+        if usage < 0:
+            raise InvalidUsageInput("usage values must be non-negative")
+
+        season = self.profile.season_strategy.get_season(when.date())
+        period = self.profile.engine.get_period_type_scalar(when)
+        return usage * self.rates.get_cost(season, period)
+
+    def _costs_from_context(
+        self, usage_kwh: pd.Series, context: pd.DataFrame
+    ) -> pd.Series:
+        if self.rates.tiered_rates:
+            return self._calculate_tiered_costs(usage_kwh, context)
 
-        context = self.profile.evaluate(usage_kwh.index)
-        unit_costs = pd.Series(
-            [
-                self.rates.get_cost(season, period)
-                for season, period in zip(context["season"], context["period"])
-            ],
-            index=usage_kwh.index,
-        )
+        unit_costs = pd.Series(self._unit_costs(context), index=usage_kwh.index)
         interval_costs = usage_kwh * unit_costs
         month_index = _month_group_index(usage_kwh.index)
         monthly_costs = interval_costs.groupby(month_index.to_period("M")).sum()
@@ -468,8 +510,20 @@ class TariffPlan:
         monthly_costs.name = "cost"
         return monthly_costs
 
-    def _calculate_tiered_costs(self, usage_kwh: pd.Series) -> pd.Series:
-        context = self.profile.evaluate(usage_kwh.index)
+    def _unit_costs(self, context: pd.DataFrame) -> npt.NDArray[Any]:
+        # Look rates up once per (season, period) pair, then gather by code
+        season_codes, seasons = pd.factorize(context["season"], use_na_sentinel=False)
+        period_codes, periods = pd.factorize(context["period"], use_na_sentinel=False)
+        rate_table = np.array(
+            [[self.rates.get_cost(s, p) for p in periods] for s in seasons]
+        ).reshape(len(seasons), len(periods))
+        return rate_table[season_codes, period_codes]
+
+    def _calculate_tiered_costs(
+        self, usage_kwh: pd.Series, context: pd.DataFrame | None = None
+    ) -> pd.Series:
+        if context is None:
+            context = self.profile.evaluate(usage_kwh.index)
         billing_costs: dict[pd.Timestamp, float] = {}
 
         # Use billing period grouping instead of monthly grouping
@@ -477,15 +531,14 @@ class TariffPlan:
             _billing_period_group_index(usage_kwh.index, self.billing_cycle_type)
         )
 
-        sorted_tiers = sorted(self.rates.tiered_rates, key=lambda x: x.start_kwh)
-
         # For bimonthly billing, tier limits are doubled
         tier_multiplier = (
             2 if self.billing_cycle_type != BillingCycleType.MONTHLY else 1
         )
+        schedule = _tier_schedule(tuple(self.rates.tiered_rates), tier_multiplier)
 
         for period, period_usage in period_groups:
-            total_usage_kwh = period_usage.sum()
+            total_usage_kwh = _total_kwh(period_usage)
             if total_usage_kwh == 0:
                 billing_costs[period.to_timestamp()] = 0.0
                 continue
@@ -494,35 +547,11 @@ class TariffPlan:
             season = period_context["season"].mode().iloc[0]
             season_label = _label_value(season)
 
-            total_cost = 0.0
-            remaining_kwh = total_usage_kwh
-            last_limit_kwh = 0.0
-
-            for tier in sorted_tiers:
-                if remaining_kwh <= 0:
-                    break
-
-                # Adjust tier limits for bimonthly billing
-                tier_end = tier.end_kwh if tier.end_kwh < 999999 else float("inf")
-                tier_start = last_limit_kwh
-                tier_end = (
-                    tier_end if tier_multiplier == 1 else tier_end * tier_multiplier
-                )
-
-                # Calculate usage within this tier
-                tier_limit_kwh = tier_end - tier_start
-
-                usage_in_tier_kwh = min(remaining_kwh, tier_limit_kwh)
-
-                unit_cost = (
-                    tier.summer_cost
-                    if season_label == SeasonType.SUMMER.value
-                    else tier.non_summer_cost
-                )
-
-                total_cost += usage_in_tier_kwh * unit_cost
-                remaining_kwh -= usage_in_tier_kwh
-                last_limit_kwh = tier_end
+            total_cost = _tiered_cost(
+                total_usage_kwh,
+                schedule,
+                season_label == SeasonType.SUMMER.value,
+            )
 
             billing_costs[period.to_timestamp()] = total_cost
 
@@ -539,7 +568,17 @@ class TariffPlan:
             raise TariffError("pandas is required for cost calculation")
         _validate_usage_series(usage_kwh)
 
-        month_index = _month_group_index(usage_kwh.index)
+        breakdown = self._breakdown_core(usage_kwh)
+        if not include_shares:
+            return breakdown
+        if self.rates.tiered_rates:
+            # One row per billing period, so each row is the whole period
+            breakdown["usage_share"] = 1.0
+            breakdown["cost_share"] = 1.0
+            return breakdown
+        return self._attach_shares(breakdown)
+
+    def _breakdown_core(self, usage_kwh: pd.Series) -> pd.DataFrame:
         context = self.profile.evaluate(usage_kwh.index)
 
         if self.rates.tiered_rates:
@@ -549,7 +588,7 @@ class TariffPlan:
                 usage_kwh.index, self.billing_cycle_type
             )
             monthly_usage = usage_kwh.groupby(billing_period_index).sum()
-            monthly_costs = self._calculate_tiered_costs(usage_kwh)
+            monthly_costs = self._calculate_tiered_costs(usage_kwh, context)
             month_seasons = (
                 context["season"]
                 .groupby(billing_period_index)
@@ -567,65 +606,129 @@ class TariffPlan:
                         "cost": float(monthly_costs.loc[month_ts]),
                     }
                 )
-            result = pd.DataFrame(
+            return pd.DataFrame(
                 records,
                 columns=["month", "season", "period", "usage_kwh", "cost"],
             )
-            if include_shares:
-                result["usage_share"] = 1.0
-                result["cost_share"] = 1.0
-                return result[
-                    [
-                        "month",
-                        "season",
-                        "period",
-                        "usage_kwh",
-                        "cost",
-                        "usage_share",
-                        "cost_share",
-                    ]
-                ]
-            return result
 
-        unit_costs = pd.Series(
-            [
-                self.rates.get_cost(season, period)
-                for season, period in zip(context["season"], context["period"])
-            ],
-            index=usage_kwh.index,
-        )
+        month_index = _month_group_index(usage_kwh.index)
+        unit_costs = self._unit_costs(context)
         base = pd.DataFrame(
             {
                 "month": month_index.to_period("M"),
                 "season": context["season"].apply(_label_value),
                 "period": context["period"].apply(_label_value),
                 "usage_kwh": usage_kwh.values,
-                "cost": (usage_kwh * unit_costs).values,
+                "cost": usage_kwh.values * unit_costs,
             }
         )
         grouped = base.groupby(
             ["month", "season", "period"], sort=False, as_index=False
         ).sum()
         grouped["month"] = grouped["month"].dt.to_timestamp()
-        if include_shares:
-            month_totals = grouped.groupby("month", sort=False)[
-                ["usage_kwh", "cost"]
-            ].transform("sum")
-            grouped["usage_share"] = grouped["usage_kwh"] / month_totals["usage_kwh"]
-            grouped["cost_share"] = grouped["cost"] / month_totals["cost"]
-            return grouped[
-                [
-                    "month",
-                    "season",
-                    "period",
-                    "usage_kwh",
-                    "cost",
-                    "usage_share",
-                    "cost_share",
-                ]
-            ]
         return grouped[["month", "season", "period", "usage_kwh", "cost"]]
 
+    @staticmethod
+    def _attach_shares(breakdown: pd.DataFrame) -> pd.DataFrame:
+        """Add each row's share of its month's usage and cost."""
+        month_totals = breakdown.groupby("month", sort=False)[
+            ["usage_kwh", "cost"]
+        ].transform("sum")
+        breakdown["usage_share"] = breakdown["usage_kwh"] / month_totals["usage_kwh"]
+        breakdown["cost_share"] = breakdown["cost"] / month_totals["cost"]
+        return breakdown
+
+
+def _strategy_key(profile: TariffProfile) -> tuple[Any, Any]:
+    """Key under which profiles classify timestamps identically."""
+    season_strategy = profile.season_strategy
+    if type(season_strategy) is TaiwanSeasonStrategy:
+        season_key: Any = (season_strategy._start, season_strategy._end)
+    else:
+        season_key = id(season_strategy)
+    day_type_strategy = profile.day_type_strategy
+    if type(day_type_strategy) is TaiwanDayTypeStrategy:
+        day_type_key: Any = ("taiwan", id(day_type_strategy._calendar))
+    else:
+        day_type_key = id(day_type_strategy)
+    return season_key, day_type_key
+
+
+def calculate_costs_multi(
+    usage_kwh: pd.Series, plans: dict[str, TariffPlan]
+) -> dict[str, pd.Series]:
+    """Calculate costs of the same usage under several plans.
+
+    Season and day type classification is done once per group of plans that
+    share strategies; each plan then only applies its own schedule and rates.
+    """
+    if pd is None:
+        raise TariffError("pandas is required for cost calculation")
+    _validate_usage_series(usage_kwh)
+
+    index = usage_kwh.index
+    day_contexts: dict[tuple[Any, Any], tuple[pd.Index, pd.Index]] = {}
+    results: dict[str, pd.Series] = {}
+    for plan_id, tariff_plan in plans.items():
+        engine = tariff_plan.profile.engine
+        key = _strategy_key(tariff_plan.profile)
+        day_context = day_contexts.get(key)
+        if day_context is None:
+            day_context = engine.classify_days(index)
+            day_contexts[key] = day_context
+        context = engine.evaluate(index, day_context)
+        results[plan_id] = tariff_plan._costs_from_context(usage_kwh, context)
+    return results
+
+
+class _TierSchedule(NamedTuple):
+    lower_kwh: npt.NDArray[np.float64]
+    upper_kwh: npt.NDArray[np.float64]
+    summer_rates: npt.NDArray[np.float64]
+    non_summer_rates: npt.NDArray[np.float64]
+
+
+@functools.lru_cache(maxsize=32)
+def _tier_schedule(
+    tiers: tuple[ConsumptionTier, ...], multiplier: int = 1
+) -> _TierSchedule:
+    """Compile consumption tiers into cumulative kWh bounds and rate arrays.
+
+    Tier ends at or above 999999 kWh are open-ended. ``multiplier`` scales the
+    bounds, e.g. 2 for bimonthly billing periods.
+    """
+    sorted_tiers = sorted(tiers, key=lambda x: x.start_kwh)
+    upper = np.array(
+        [
+            tier.end_kwh * multiplier if tier.end_kwh < 999999 else np.inf
+            for tier in sorted_tiers
+        ],
+        dtype=np.float64,
+    )
+    lower = np.concatenate(([0.0], upper[:-1]))
+    summer = np.array([tier.summer_cost for tier in sorted_tiers], dtype=np.float64)
+    non_summer = np.array(
+        [tier.non_summer_cost for tier in sorted_tiers], dtype=np.float64
+    )
+    for array in (lower, upper, summer, non_summer):
+        array.setflags(write=False)
+    return _TierSchedule(lower, upper, summer, non_summer)
+
+
+def _total_kwh(usage: pd.Series) -> float:
+    # Accumulate in float64 so float32 usage does not leak into costs
+    return float(usage.to_numpy(dtype=np.float64).sum())
+
+
+def _tiered_cost(total_kwh: float, schedule: _TierSchedule, summer: bool) -> float:
+    if total_kwh <= 0:
+        return 0.0
+    usage_in_tier = np.clip(
+        total_kwh - schedule.lower_kwh, 0.0, schedule.upper_kwh - schedule.lower_kwh
+    )
+    rates = schedule.summer_rates if summer else schedule.non_summer_rates
+    return float((usage_in_tier * rates).sum())
+
 
 def _month_group_index(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
     if index.tz is None:
@@ -783,9 +886,10 @@ def _billing_period_group_index(
         # Formula: ceiling division to even number: ((month + 1) // 2) * 2
         group = ((month + 1) // 2) * 2
 
-    # Build PeriodIndex by creating period strings and converting
-    period_strs = [f"{int(y)}-{int(g)}" for y, g in zip(year, group)]
-    return pd.PeriodIndex(period_strs, freq="M")
+    # Build PeriodIndex from month offsets since the epoch (datetime64[M]),
+    # avoiding per-row string formatting and parsing
+    month_offsets = (year.astype(np.int64) - 1970) * 12 + (group - 1)
+    return pd.DatetimeIndex(month_offsets.astype("datetime64[M]")).to_period("M")
 
 
 def _validate_usage_series(usage_kwh: pd.Series) -> None:
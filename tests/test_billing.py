@@ -162,3 +162,85 @@ def test_for_residential_does_not_warn_unknown_basic_fee(empty_cache_file) -> No
             cache_dir=empty_cache_file,
         )
     assert not any("Unknown keys in basic_fee_inputs" in str(w.message) for w in record)
+
+
+def test_calculate_bill_float32_usage_keeps_float64_costs(empty_cache_file) -> None:
+    index = pd.to_datetime(["2025-02-01 00:00"])
+    inputs = tou.BillingInputs(
+        meter_phase="single",
+        meter_voltage_v=110,
+        meter_ampere=10,
+    )
+    expected = tou.calculate_bill(
+        pd.Series([300.0], index=index),
+        "residential_non_tou",
+        inputs=inputs,
+        cache_dir=empty_cache_file,
+    )
+    result = tou.calculate_bill(
+        pd.Series([300.0], index=index, dtype="float32"),
+        "residential_non_tou",
+        inputs=inputs,
+        cache_dir=empty_cache_file,
+    )
+    assert result["energy_cost"].dtype == "float64"
+    assert result["energy_cost"].iloc[0] == expected["energy_cost"].iloc[0]
+
+
+def test_calculate_bill_does_not_mutate_inputs(empty_cache_file) -> None:
+    usage = pd.Series([10.0], index=pd.to_datetime(["2025-07-01 00:00"]))
+    inputs = tou.BillingInputs(
+        meter_phase="single",
+        meter_voltage_v=110,
+        meter_ampere=10,
+    )
+    tou.calculate_bill(
+        usage,
+        "residential_non_tou",
+        inputs=inputs,
+        cache_dir=empty_cache_file,
+    )
+    assert inputs.billing_cycle_months is None
+
+
+@pytest.mark.parametrize(
+    ("usage_kwh", "month"),
+    [(0.0, 2), (200.0, 2), (300.0, 7), (2500.0, 10)],
+)
+def test_calculate_bill_scalar_matches_calculate_bill(
+    empty_cache_file, usage_kwh, month
+) -> None:
+    inputs = tou.BillingInputs(
+        meter_phase="single",
+        meter_voltage_v=110,
+        meter_ampere=10,
+    )
+    expected = tou.calculate_bill(
+        pd.Series([usage_kwh], index=pd.to_datetime([datetime(2025, month, 1)])),
+        "residential_non_tou",
+        inputs=inputs,
+        cache_dir=empty_cache_file,
+    ).iloc[0]
+    result = tou.calculate_bill_scalar(
+        usage_kwh, "residential_non_tou", 2025, month, inputs=inputs
+    )
+
+    for column in ("energy_cost", "basic_cost", "surcharge", "adjustment", "total"):
+        assert result[column] == pytest.approx(expected[column])
+
+
+def test_calculate_bill_scalar_rejects_tou_plan() -> None:
+    with pytest.raises(tou.InvalidUsageInput):
+        tou.calculate_bill_scalar(100.0, "residential_simple_2_tier", 2025, 7)
+
+
+def test_clear_plan_cache_drops_billing_plans(empty_cache_file) -> None:
+    from taipower_tou.billing import _tariff_plan_for_id
+
+    index = pd.to_datetime(["2025-07-15 10:00", "2025-07-15 23:00"])
+    usage = pd.Series([1.0, 2.0], index=index)
+    tou.calculate_bill(usage, "residential_simple_2_tier", cache_dir=empty_cache_file)
+    assert _tariff_plan_for_id.cache_info().currsize > 0
+
+    tou.clear_plan_cache()
+    assert _tariff_plan_for_id.cache_info().currsize == 0
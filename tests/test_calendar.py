@@ -4,7 +4,11 @@ from unittest.mock import patch
 
 import pytest
 
-from taipower_tou.calendar import TaiwanCalendar
+from taipower_tou.calendar import (
+    TaiwanCalendar,
+    clear_calendar_cache,
+    taiwan_calendar,
+)
 
 
 @pytest.fixture
@@ -42,3 +46,13 @@ def test_taiwan_calendar_cached_holiday(tmp_path) -> None:
 
     cal = TaiwanCalendar(cache_dir=tmp_path)
     assert cal.is_holiday(date(2025, 10, 10)) is True
+
+
+def test_taiwan_calendar_is_shared_per_settings(tmp_path) -> None:
+    calendar = taiwan_calendar(cache_dir=tmp_path)
+
+    assert taiwan_calendar(cache_dir=tmp_path) is calendar
+    assert taiwan_calendar(str(tmp_path), 10) is calendar
+    assert taiwan_calendar(cache_dir=tmp_path, api_timeout=1) is not calendar
+    clear_calendar_cache()
+    assert taiwan_calendar(cache_dir=tmp_path) is not calendar
@@ -1,4 +1,6 @@
 import json
+import subprocess
+import sys
 from datetime import date, datetime, time
 
 import pandas as pd
@@ -7,6 +9,7 @@ import pytest
 import taipower_tou as tou
 from taipower_tou.calendar import TaiwanCalendar
 from taipower_tou.errors import InvalidUsageInput, PowerKitError, TariffError
+from taipower_tou.models import BillingCycleType
 from taipower_tou.tariff import (
     DaySchedule,
     PeriodType,
@@ -68,6 +71,9 @@ def test_entry_calendar_and_tariffs(tmp_path) -> None:
     assert calendar.is_holiday(date(2024, 1, 1))
     assert tou.is_holiday(date(2024, 1, 1), calendar=calendar)
 
+    targets = [date(2024, 1, 1), datetime(2024, 1, 2, 9, 0), date(2024, 1, 7)]
+    assert tou.are_holidays(targets, calendar=calendar) == [True, False, True]
+
     helper_calendar = tou.taiwan_calendar(cache_dir=tmp_path)
     assert helper_calendar.is_holiday(date(2024, 1, 1))
 
@@ -146,3 +152,152 @@ def test_get_plan_requirements_supports_chinese_name() -> None:
     req = tou.get_plan_requirements("簡易型二段式")
     assert "requires_contract_capacity" in req
     assert "valid_basic_fee_labels" in req
+
+
+def test_plan_reuses_cached_instance(tmp_path) -> None:
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    first = tou.plan("residential_simple_2_tier", calendar_instance=calendar)
+    second = tou.plan("residential_simple_2_tier", calendar_instance=calendar)
+    assert first is not second
+    assert first.profile is second.profile
+    assert first.rates is second.rates
+
+    tou.clear_plan_cache()
+    third = tou.plan("residential_simple_2_tier", calendar_instance=calendar)
+    assert third.rates is not first.rates
+
+
+def test_plan_changes_do_not_leak_into_cache(tmp_path) -> None:
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    changed = tou.plan("residential_non_tou", calendar_instance=calendar)
+    changed.billing_cycle_type = BillingCycleType.ODD_MONTH
+
+    again = tou.plan("residential_non_tou", calendar_instance=calendar)
+    assert again.billing_cycle_type == BillingCycleType.MONTHLY
+
+
+def test_billing_helpers_load_lazily() -> None:
+    code = (
+        "import sys, taipower_tou as tou\n"
+        "assert 'taipower_tou.billing' not in sys.modules\n"
+        "assert 'calculate_bill' in dir(tou)\n"
+        "assert 'taipower_tou.billing' not in sys.modules\n"
+        "from taipower_tou.billing import calculate_bill\n"
+        "assert tou.calculate_bill is calculate_bill\n"
+        "assert tou.BillingInputs.__module__ == 'taipower_tou.billing'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    with pytest.raises(AttributeError):
+        _ = tou.not_a_real_attribute
+
+
+def test_available_plans_returns_independent_copies() -> None:
+    plans = tou.available_plans()
+    plans.pop("residential_simple_2_tier")
+    assert "residential_simple_2_tier" in tou.available_plans()
+
+
+def test_calculate_costs_multi_matches_per_plan_costs(tmp_path) -> None:
+    (tmp_path / "2025.json").write_text("[]", encoding="utf-8")
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    index = pd.date_range("2025-05-25", "2025-06-10", freq="h", inclusive="left")
+    usage = pd.Series(range(len(index)), index=index, dtype=float) % 7
+    plan_ids = [
+        "residential_non_tou",
+        "residential_simple_2_tier",
+        "residential_simple_3_tier",
+        "high_voltage_2_tier",
+    ]
+
+    results = tou.calculate_costs_multi(usage, plan_ids, calendar_instance=calendar)
+
+    assert list(results) == plan_ids
+    for plan_id in plan_ids:
+        expected = tou.costs(usage, plan_id, calendar_instance=calendar)
+        pd.testing.assert_series_equal(results[plan_id], expected)
+
+
+def test_plan_cache_is_keyed_by_canonical_id(tmp_path) -> None:
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    by_id = tou.plan("residential_simple_2_tier", calendar_instance=calendar)
+    by_name = tou.plan("簡易型二段式", calendar_instance=calendar)
+    assert by_name.rates is by_id.rates
+
+    with pytest.raises(ValueError, match="Unsupported plan name"):
+        tou.plan("nonexistent_plan", calendar_instance=calendar)
+
+
+def test_get_plan_requirements_returns_fresh_results() -> None:
+    first = tou.get_plan_requirements("high_voltage_2_tier")
+    first["valid_basic_fee_labels"].clear()
+    second = tou.get_plan_requirements("高壓電力二段式")
+    assert second["requires_contract_capacity"] is True
+    assert second["valid_basic_fee_labels"]
+
+
+def test_batch_helpers_match_single_target_helpers(tmp_path) -> None:
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    targets = [datetime(2025, 7, 15, 10, 0), datetime(2025, 7, 13, 10, 0)]
+    plan_id = "residential_simple_2_tier"
+
+    periods = tou.period_at_many(targets, plan_id, calendar_instance=calendar)
+    assert periods == [
+        tou.period_at(t, plan_id, calendar_instance=calendar) for t in targets
+    ]
+    contexts = tou.period_context_many(iter(targets), plan_id, calendar)
+    assert contexts == [
+        tou.period_context(t, plan_id, calendar_instance=calendar) for t in targets
+    ]
+
+    usages = [
+        pd.Series([1.0, 2.0], index=pd.DatetimeIndex(targets).sort_values()),
+        pd.Series([3.0], index=pd.DatetimeIndex([targets[0]])),
+    ]
+    for result, usage in zip(
+        tou.costs_many(usages, plan_id, calendar_instance=calendar), usages
+    ):
+        expected = tou.costs(usage, plan_id, calendar_instance=calendar)
+        pd.testing.assert_series_equal(result, expected)
+
+
+def test_helpers_accept_prebuilt_plan(tmp_path) -> None:
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    plan_id = "residential_simple_2_tier"
+    prebuilt = tou.plan(plan_id, calendar_instance=calendar)
+    target = datetime(2025, 7, 15, 10, 0)
+    usage = pd.Series(
+        [1.0, 2.0], index=pd.DatetimeIndex([target, target.replace(hour=11)])
+    )
+
+    assert tou.period_at(target, prebuilt) == tou.period_at(
+        target, plan_id, calendar_instance=calendar
+    )
+    assert tou.plan_details(prebuilt) == prebuilt.describe()
+    pd.testing.assert_series_equal(
+        tou.costs(usage, prebuilt),
+        tou.costs(usage, plan_id, calendar_instance=calendar),
+    )
+    assert tou.pricing_context(target, prebuilt) == tou.pricing_context(
+        target, plan_id, calendar_instance=calendar
+    )
+
+
+def test_make_fn_helpers_bind_plan(tmp_path) -> None:
+    calendar = TaiwanCalendar(cache_dir=tmp_path)
+    plan_id = "residential_simple_2_tier"
+    target = datetime(2025, 7, 15, 10, 0)
+    usage = pd.Series([1.0], index=pd.DatetimeIndex([target]))
+
+    cost_fn = tou.make_cost_fn(plan_id, calendar_instance=calendar)
+    pd.testing.assert_series_equal(
+        cost_fn(usage), tou.costs(usage, plan_id, calendar_instance=calendar)
+    )
+    period_fn = tou.make_period_fn(plan_id, calendar_instance=calendar)
+    assert period_fn(target) == tou.period_at(
+        target, plan_id, calendar_instance=calendar
+    )
+    context_fn = tou.make_context_fn(plan_id, calendar_instance=calendar)
+    assert context_fn(target) == tou.period_context(
+        target, plan_id, calendar_instance=calendar
+    )
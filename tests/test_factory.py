@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 
 import taipower_tou as tou
-from taipower_tou.factory import TariffFactory
+from taipower_tou.factory import PlanStore, TariffFactory, _plan_store
 
 
 class TestAllPlans:
@@ -172,3 +172,45 @@ class TestTariffFactory:
 
         plan = TariffFactory.create("residential_simple_2_tier")
         assert plan is not None
+
+
+class TestPlanStore:
+    """Tests for the PlanStore lookup helpers."""
+
+    def test_get_plan_uses_id_index(self) -> None:
+        """Every listed plan ID resolves to its own plan data."""
+        store = PlanStore()
+        for plan_id in store.list_plan_ids():
+            assert store.get_plan(plan_id)["id"] == plan_id
+
+        with pytest.raises(KeyError, match="Plan not found"):
+            store.get_plan("nonexistent_plan")
+
+        assert "residential_simple_2_tier" in store
+        assert "簡易型二段式" not in store
+
+    def test_resolve_plan_id_flexible_names(self) -> None:
+        """Chinese and partial names resolve to canonical IDs."""
+        store = PlanStore()
+        assert store.resolve_plan_id("簡易型二段式") == "residential_simple_2_tier"
+        assert store.resolve_plan_id("simple_3") == "residential_simple_3_tier"
+        with pytest.raises(KeyError, match="Ambiguous"):
+            store.resolve_plan_id("二段式")
+
+        assert store.resolve_plan_id("簡易型二段式") == "residential_simple_2_tier"
+        assert store.resolve_plan("簡易型二段式")["id"] == "residential_simple_2_tier"
+
+    def test_default_store_is_shared(self) -> None:
+        """Factories without an explicit store share one parsed plans.json."""
+        assert _plan_store() is _plan_store()
+        assert TariffFactory()._store is _plan_store()
+
+    def test_list_plan_ids_is_cached_per_store(self) -> None:
+        """Each store computes its plan ID tuple once."""
+        store = PlanStore()
+        assert store.list_plan_ids() is store.list_plan_ids()
+        assert PlanStore().list_plan_ids() == store.list_plan_ids()
+
+    def test_plan_store_is_exported(self) -> None:
+        """PlanStore stays importable from the package root."""
+        assert tou.PlanStore is PlanStore
@@ -12,7 +12,14 @@ from taipower_tou import (
     pricing_context,
 )
 from taipower_tou.calendar import TaiwanCalendar
-from taipower_tou.tariff import PeriodType, SeasonType, get_period
+from taipower_tou.models import ConsumptionTier
+from taipower_tou.tariff import (
+    PeriodType,
+    SeasonType,
+    _tier_schedule,
+    _tiered_cost,
+    get_period,
+)
 
 
 def _calendar_with_cache(tmp_path) -> TaiwanCalendar:
@@ -101,6 +108,20 @@ def test_monthly_breakdown_tiered(tmp_path) -> None:
     assert set(result["period"]) == {"tiered"}
 
 
+def test_attach_shares_matches_include_shares(tmp_path) -> None:
+    calendar = _calendar_with_cache(tmp_path)
+    tariff_plan = plan("residential_simple_3_tier", calendar_instance=calendar)
+    index = pd.date_range("2025-06-28", "2025-07-03", freq="h", inclusive="left")
+    usage = pd.Series(1.5, index=index)
+
+    breakdown = tariff_plan.monthly_breakdown(usage)
+    with_shares = tariff_plan.monthly_breakdown(usage, include_shares=True)
+
+    pd.testing.assert_frame_equal(tariff_plan._attach_shares(breakdown), with_shares)
+    monthly_share = with_shares.groupby("month")["cost_share"].sum()
+    assert monthly_share.to_numpy() == pytest.approx([1.0, 1.0])
+
+
 def test_period_context_details(tmp_path) -> None:
     calendar = _calendar_with_cache(tmp_path)
     dt = datetime(2025, 7, 15, 10, 0)
@@ -218,3 +239,37 @@ def test_pricing_context_tiered_with_usage_error(tmp_path) -> None:
             usage=1.0,
             calendar_instance=calendar,
         )
+
+
+def test_calculate_cost_scalar_matches_series_costs(tmp_path) -> None:
+    calendar = _calendar_with_cache(tmp_path)
+    tariff_plan = plan("residential_simple_2_tier", calendar_instance=calendar)
+
+    for when in (datetime(2025, 7, 15, 14, 0), datetime(2025, 7, 13, 2, 0)):
+        usage = pd.Series([1.5], index=pd.DatetimeIndex([when]))
+        expected = tariff_plan.calculate_costs(usage).iloc[0]
+        assert tariff_plan.calculate_cost_scalar(when, 1.5) == pytest.approx(expected)
+
+    with pytest.raises(InvalidUsageInput):
+        tariff_plan.calculate_cost_scalar(datetime(2025, 7, 15, 14, 0), -1.0)
+
+    tiered_plan = plan("residential_non_tou", calendar_instance=calendar)
+    with pytest.raises(InvalidUsageInput):
+        tiered_plan.calculate_cost_scalar(datetime(2025, 7, 15, 14, 0), 1.0)
+
+
+def test_tier_schedule_doubles_bounds_and_prices_each_tier() -> None:
+    tiers = (
+        ConsumptionTier(0, 120, 1.78, 1.78),
+        ConsumptionTier(120, 330, 2.55, 2.26),
+        ConsumptionTier(330, 999999, 3.8, 3.13),
+    )
+    schedule = _tier_schedule(tiers, 2)
+
+    assert schedule is _tier_schedule(tiers, 2)
+    assert schedule.upper_kwh.tolist() == [240.0, 660.0, float("inf")]
+    assert _tiered_cost(0.0, schedule, True) == 0.0
+    assert _tiered_cost(300.0, schedule, False) == pytest.approx(240 * 1.78 + 60 * 2.26)
+    assert _tiered_cost(700.0, schedule, True) == pytest.approx(
+        240 * 1.78 + 420 * 2.55 + 40 * 3.8
+    )